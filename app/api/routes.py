@@ -1,29 +1,105 @@
 """
 FastAPI routes for EKS Kubernetes operations.
-All routes wrap service calls in try/except blocks and return structured JSON responses.
+All routes return structured JSON responses; the eks_route decorator converts
+exceptions into HTTP errors.
 
 Request Flow:
-1. Request enters route handler
+1. Request enters route handler (request ID already assigned by RequestIDMiddleware)
 2. Request parameters validated and logged
-3. EKS service called with operation logging
+3. EKS service called with operation logging (in a worker thread via
+   asyncio.to_thread, so the blocking Kubernetes client never stalls the
+   event loop)
 4. Response returned with status code and data
-5. Exceptions caught and converted to appropriate HTTP errors
-6. All operations logged with timing and result status
+5. Exceptions converted to appropriate HTTP errors by eks_route
+6. All operations logged with result status; durations recorded in Prometheus (/metrics)
 """
-from fastapi import APIRouter, HTTPException, Query, Request
-from typing import Dict, Any, Optional
+import asyncio
+import logging
+from functools import wraps
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from typing import Dict, Any, AsyncIterator, Callable, List, Optional, Type
 from pydantic import BaseModel, Field
 from kubernetes.client.rest import ApiException
-from uuid import uuid4
+import orjson
 import time
+from datetime import datetime
+from uuid import uuid4
 
-from app.services.eks_operations import get_eks_service
-from app.utils.logger import get_logger, log_operation, set_request_id, get_request_id
+from app.services.eks_operations import TERMINAL_JOB_STATES, EKSOperationsService
+from app.services.job_watcher import JobStatusWatcher, validate_callback_url
+from app.utils.logger import get_logger
 from app.core.config import settings
 
-logger = get_logger(__name__, settings.log_level)
+LOG_LEVEL = settings.log_level
+logger = get_logger(__name__, LOG_LEVEL)
+# The log level is fixed at startup, so per-request INFO logs check this
+# flag instead of going through the logging level machinery
+INFO_ENABLED = logger.isEnabledFor(logging.INFO)
 router = APIRouter(prefix="/api", tags=["eks"])
 
+async def get_eks(http_request: Request) -> EKSOperationsService:
+    """
+    Dependency provider for the EKS operations service.
+    Returns the long-lived instance created in the application lifespan.
+    Async, so FastAPI resolves it on the event loop instead of in a thread.
+    """
+    return http_request.app.state.eks
+
+
+def eks_route(operation: str, not_found: Optional[str] = None) -> Callable:
+    """
+    Decorator translating exceptions raised by a route handler into HTTP errors.
+    
+    Successful results are wrapped in an ORJSONResponse directly. The service
+    already returns dicts in the shape of the route's response_model, so
+    FastAPI's per-response validation pass is skipped; response_model is
+    kept on the routes for the OpenAPI schema.
+    
+    - HTTPException: passed through unchanged
+    - ApiException 404 with not_found set: 404 with not_found as detail,
+      formatted with the handler's keyword arguments
+      (e.g. "Job {job_name} not found" or "Job {request.job_name} not found").
+      The 404 is returned as a response rather than raised, since lookups of
+      missing jobs are a routine case for polling clients.
+    - Other ApiException: same status code (500 if missing) with the reason
+    - Any other exception: 500
+    
+    functools.wraps keeps the handler signature, so FastAPI still sees the
+    original parameters and dependencies.
+    """
+    def decorator(handler: Callable) -> Callable:
+        @wraps(handler)
+        async def wrapper(*args, **kwargs):
+            try:
+                result = await handler(*args, **kwargs)
+            except HTTPException:
+                raise
+            except ApiException as e:
+                if e.status == 404 and not_found is not None:
+                    detail = not_found.format(**kwargs)
+                    logger.warning("%s: %s", operation, detail)
+                    return ORJSONResponse(status_code=404, content={"detail": detail})
+                logger.error(
+                    "Kubernetes API error in %s: %s (status=%s)", operation, e.reason, e.status,
+                    exc_info=True
+                )
+                raise HTTPException(
+                    status_code=e.status or 500,
+                    detail=f"Kubernetes API error: {e.reason}"
+                )
+            except Exception as e:
+                logger.error("Unexpected error in %s: %s", operation, e, exc_info=True)
+                raise HTTPException(
+                    status_code=500,
+                    detail=f"Internal server error: {str(e)}"
+                )
+            if isinstance(result, Response):
+                return result
+            return ORJSONResponse(result)
+        return wrapper
+    return decorator
+
 
 # ============================================================================
 # Request/Response Models
@@ -39,6 +115,34 @@ class JobManifestRequest(BaseModel):
         default="default",
         description="Kubernetes namespace where the job will be created"
     )
+    callback_url: Optional[str] = Field(
+        default=None,
+        description="Optional URL that receives a POST with the job status once the job completes or fails"
+    )
+
+
+class JobBatchRequest(BaseModel):
+    """Request model for creating several Kubernetes Jobs in one call."""
+    jobs: List[JobManifestRequest] = Field(
+        ...,
+        description="Jobs to create; each item has the same fields as the create-job request"
+    )
+
+
+class JobWebhookRequest(BaseModel):
+    """Request model for registering a job completion webhook."""
+    job_name: str = Field(
+        ...,
+        description="Name of the job to watch"
+    )
+    namespace: str = Field(
+        default="default",
+        description="Kubernetes namespace of the job"
+    )
+    callback_url: str = Field(
+        ...,
+        description="URL that receives a POST with the job status once the job completes or fails"
+    )
 
 
 class NamespaceRequest(BaseModel):
@@ -57,22 +161,32 @@ class JobStatusResponse(BaseModel):
     active: int
     succeeded: int
     failed: int
-    start_time: Optional[str]
-    completion_time: Optional[str]
+    start_time: Optional[datetime]
+    completion_time: Optional[datetime]
+
+
+class JobsStatusResponse(BaseModel):
+    """Response model for bulk job status (null for jobs that were not found)."""
+    jobs: Dict[str, Optional[JobStatusResponse]]
 
 
 class JobCreateResponse(BaseModel):
     """Response model for job creation."""
     job_name: str
     namespace: str
-    creation_timestamp: Optional[str]
+    creation_timestamp: Optional[datetime]
     status: str
 
 
+class JobBatchCreateResponse(BaseModel):
+    """Response model for batch job creation."""
+    jobs: List[JobCreateResponse]
+
+
 class NamespaceCreateResponse(BaseModel):
     """Response model for namespace creation."""
     namespace_name: str
-    creation_timestamp: Optional[str]
+    creation_timestamp: Optional[datetime]
     status: str
 
 
@@ -82,6 +196,109 @@ class SuccessResponse(BaseModel):
     status: str
 
 
+def _request_body_schema(model: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    JSON schema of a request model for openapi_extra, with nested models inlined.
+    
+    openapi_extra is merged into the OpenAPI document as-is, where refs
+    resolve against the document root; Pydantic's "#/$defs/..." refs (and
+    the "$defs" they point to) would not resolve there.
+    """
+    schema = model.model_json_schema()
+    defs = schema.pop("$defs", {})
+    
+    def inline(node: Any) -> Any:
+        if isinstance(node, dict):
+            if "$ref" in node:
+                return inline(defs[node["$ref"].rsplit("/", 1)[-1]])
+            return {key: inline(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [inline(item) for item in node]
+        return node
+    
+    return inline(schema)
+
+
+def _check_callback_url(callback_url: str) -> None:
+    """Reject a webhook URL that may not be called (422, see validate_callback_url)."""
+    try:
+        validate_callback_url(callback_url)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+
+def _job_manifest_request(payload: Any) -> JobManifestRequest:
+    """
+    Type-check the top-level fields of one create-job payload.
+    
+    Job manifests are opaque to this API and passed to Kubernetes as-is, so
+    the manifest dict is not walked by Pydantic.
+    """
+    if not isinstance(payload, dict) or not isinstance(payload.get("job_manifest"), dict):
+        raise HTTPException(status_code=422, detail="job_manifest is required and must be an object")
+    namespace = payload.get("namespace", "default")
+    if namespace is not None and not isinstance(namespace, str):
+        raise HTTPException(status_code=422, detail="namespace must be a string")
+    callback_url = payload.get("callback_url")
+    if callback_url is not None and not isinstance(callback_url, str):
+        raise HTTPException(status_code=422, detail="callback_url must be a string")
+    if callback_url:
+        _check_callback_url(callback_url)
+    
+    return JobManifestRequest.model_construct(
+        job_manifest=payload["job_manifest"],
+        namespace=namespace,
+        callback_url=callback_url
+    )
+
+
+async def _json_body(http_request: Request) -> Any:
+    """Parse the request body with orjson (422 on invalid JSON)."""
+    try:
+        return orjson.loads(await http_request.body())
+    except orjson.JSONDecodeError as e:
+        raise HTTPException(status_code=422, detail=f"Invalid JSON body: {str(e)}")
+
+
+async def parse_job_manifest_request(http_request: Request) -> JobManifestRequest:
+    """
+    Dependency parsing the create-job body with orjson.
+    
+    Only the top-level fields are type-checked (see _job_manifest_request).
+    JobManifestRequest is still used for the OpenAPI schema (see
+    openapi_extra on the route) and as the handler's type.
+    """
+    return _job_manifest_request(await _json_body(http_request))
+
+
+async def parse_job_batch_request(http_request: Request) -> JobBatchRequest:
+    """Dependency parsing the batch create-job body; same checks as parse_job_manifest_request per job."""
+    payload = await _json_body(http_request)
+    if not isinstance(payload, dict) or not isinstance(payload.get("jobs"), list) or not payload["jobs"]:
+        raise HTTPException(status_code=422, detail="jobs is required and must be a non-empty array")
+    if len(payload["jobs"]) > settings.create_jobs_max_batch:
+        raise HTTPException(
+            status_code=422,
+            detail=f"jobs must not contain more than {settings.create_jobs_max_batch} items"
+        )
+    return JobBatchRequest.model_construct(
+        jobs=[_job_manifest_request(job) for job in payload["jobs"]]
+    )
+
+
+def _job_name(request: JobManifestRequest) -> str:
+    """
+    Job name from the manifest metadata, or a generated timestamp-based name.
+    
+    Generated names end in random hex digits, so jobs submitted within the
+    same second (by any worker process or replica) do not collide.
+    """
+    job_name = request.job_manifest.get("metadata", {}).get("name")
+    if not job_name:
+        job_name = f"job-{time.strftime('%Y%m%d-%H%M%S')}-{uuid4().hex[:8]}"
+    return job_name
+
+
 # ============================================================================
 # Job Management Routes
 # ============================================================================
@@ -90,15 +307,27 @@ class SuccessResponse(BaseModel):
     "/eks-create-job",
     response_model=JobCreateResponse,
     summary="Create a Kubernetes Job",
-    description="Creates a new Kubernetes Job in the specified EKS namespace"
+    description="Creates a new Kubernetes Job in the specified EKS namespace",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": _request_body_schema(JobManifestRequest)}}
+        }
+    }
 )
-async def create_job(request: JobManifestRequest, http_request: Request) -> Dict[str, Any]:
+@eks_route("create_job")
+async def create_job(
+    http_request: Request,
+    request: JobManifestRequest = Depends(parse_job_manifest_request),
+    service: EKSOperationsService = Depends(get_eks)
+) -> Dict[str, Any]:
     """
     Create a Kubernetes Job in the EKS cluster.
     
     Request body:
     - job_manifest (dict, required): Kubernetes Job spec
     - namespace (string, optional, default="default"): Target namespace
+    - callback_url (string, optional): URL notified when the job completes or fails
     
     Returns:
     - job_name: Name of the created job
@@ -107,54 +336,89 @@ async def create_job(request: JobManifestRequest, http_request: Request) -> Dict
     - status: "created" on success
     
     Log Output Example:
-    - INFO: API request: create_job namespace=default request_id=a1b2c3d4
-    - START: Creating Kubernetes job
-    - END: Successfully created job=my-job duration=1234ms
+    - INFO: API request: create_job namespace=default [a1b2c3d4]
+    - DEBUG: START Creating Kubernetes job
+    - DEBUG: END Successfully created job=my-job
     """
-    request_id = str(uuid4())[:8]
-    set_request_id(request_id)
+    watcher = http_request.app.state.job_watcher
+    if request.callback_url and watcher is None:
+        raise HTTPException(
+            status_code=400,
+            detail="callback_url requires the job status watcher (JOB_WATCH_ENABLED=true)"
+        )
     
-    try:
+    if INFO_ENABLED:
         logger.info(
-            f"API request: create_job namespace={request.namespace}",
-            extra={"request_id": request_id}
+            "API request: create_job namespace=%s",
+            request.namespace
         )
-        
-        service = get_eks_service()
-        
-        # Generate job name from manifest or use timestamp-based name
-        job_name = request.job_manifest.get("metadata", {}).get("name")
-        if not job_name:
-            from datetime import datetime
-            job_name = f"job-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
-        
-        logger.debug(f"Generated job name: {job_name}")
-        
-        with log_operation(logger, "create_job", job=job_name, namespace=request.namespace):
-            result = service.create_job(
-                job_name=job_name,
-                job_manifest=request.job_manifest,
-                namespace=request.namespace
-            )
-        
-        logger.info(f"Successfully created job {job_name} in namespace {request.namespace}")
-        return result
     
-    except ApiException as e:
-        logger.error(
-            f"Kubernetes API error creating job: {e.reason} (status={e.status})",
-            exc_info=True
-        )
-        raise HTTPException(
-            status_code=e.status or 500,
-            detail=f"Kubernetes API error: {e.reason}"
-        )
-    except Exception as e:
-        logger.error(f"Unexpected error creating job: {str(e)}", exc_info=True)
+    # Generate job name from manifest or use timestamp-based name
+    job_name = _job_name(request)
+    
+    logger.debug("Generated job name: %s", job_name)
+    
+    result = await asyncio.to_thread(
+        service.create_job,
+        job_name=job_name,
+        job_manifest=request.job_manifest,
+        namespace=request.namespace
+    )
+    
+    if request.callback_url:
+        watcher.register_callback(request.namespace, job_name, request.callback_url)
+    return result
+
+
+@router.post(
+    "/eks-create-jobs",
+    response_model=JobBatchCreateResponse,
+    summary="Create several Kubernetes Jobs",
+    description="Creates a batch of Kubernetes Jobs concurrently in one request",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": _request_body_schema(JobBatchRequest)}}
+        }
+    }
+)
+@eks_route("create_jobs")
+async def create_jobs(
+    http_request: Request,
+    request: JobBatchRequest = Depends(parse_job_batch_request),
+    service: EKSOperationsService = Depends(get_eks)
+) -> Dict[str, Any]:
+    """
+    Create several Kubernetes Jobs in the EKS cluster.
+    
+    Request body:
+    - jobs (array, required): Items with the create-job fields
+      (job_manifest, namespace, callback_url); at most
+      CREATE_JOBS_MAX_BATCH items
+    
+    Returns:
+    - jobs: One create-job result per item, in request order
+    
+    Jobs are submitted in parallel; if any creation fails the request fails,
+    and jobs created before the failure are kept.
+    """
+    watcher = http_request.app.state.job_watcher
+    if watcher is None and any(job.callback_url for job in request.jobs):
         raise HTTPException(
-            status_code=500,
-            detail=f"Internal server error: {str(e)}"
+            status_code=400,
+            detail="callback_url requires the job status watcher (JOB_WATCH_ENABLED=true)"
         )
+    
+    if INFO_ENABLED:
+        logger.info("API request: create_jobs count=%d", len(request.jobs))
+    
+    specs = [(_job_name(job), job.job_manifest, job.namespace) for job in request.jobs]
+    results = await asyncio.to_thread(service.create_jobs, specs)
+    
+    for job, (job_name, _, namespace) in zip(request.jobs, specs):
+        if job.callback_url:
+            watcher.register_callback(namespace, job_name, job.callback_url)
+    return {"jobs": results}
 
 
 @router.delete(
@@ -163,9 +427,12 @@ async def create_job(request: JobManifestRequest, http_request: Request) -> Dict
     summary="Delete a Kubernetes Job",
     description="Deletes a Kubernetes Job from the EKS cluster"
 )
+@eks_route("delete_job", not_found="Job {job_name} not found in namespace {namespace}")
 async def delete_job(
+    http_request: Request,
     job_name: str = Query(..., description="Name of the job to delete"),
-    namespace: str = Query(default="default", description="Kubernetes namespace")
+    namespace: str = Query(default="default", description="Kubernetes namespace"),
+    service: EKSOperationsService = Depends(get_eks)
 ) -> Dict[str, str]:
     """
     Delete a Kubernetes Job from the EKS cluster.
@@ -180,47 +447,22 @@ async def delete_job(
     
     Log Output Example:
     - INFO: API request: delete_job job=my-job namespace=default
-    - START: Deleting Kubernetes job
-    - END: Job deleted successfully duration=567ms
+    - DEBUG: START Deleting Kubernetes job
+    - DEBUG: END Job deleted successfully
     """
-    request_id = str(uuid4())[:8]
-    set_request_id(request_id)
-    
-    try:
+    if INFO_ENABLED:
         logger.info(
-            f"API request: delete_job job={job_name} namespace={namespace}",
-            extra={"request_id": request_id}
+            "API request: delete_job job=%s namespace=%s",
+            job_name, namespace
         )
-        
-        service = get_eks_service()
-        
-        with log_operation(logger, "delete_job", job=job_name, namespace=namespace):
-            result = service.delete_job(
-                job_name=job_name,
-                namespace=namespace
-            )
-        
-        logger.info(f"Successfully deleted job {job_name} from namespace {namespace}")
-        return result
     
-    except ApiException as e:
-        if e.status == 404:
-            logger.warning(f"Job not found: {job_name} in namespace {namespace}")
-            raise HTTPException(
-                status_code=404,
-                detail=f"Job {job_name} not found in namespace {namespace}"
-            )
-        logger.error(f"Kubernetes API error deleting job: {e.reason}", exc_info=True)
-        raise HTTPException(
-            status_code=e.status or 500,
-            detail=f"Kubernetes API error: {e.reason}"
-        )
-    except Exception as e:
-        logger.error(f"Unexpected error deleting job: {str(e)}", exc_info=True)
-        raise HTTPException(
-            status_code=500,
-            detail=f"Internal server error: {str(e)}"
-        )
+    result = await asyncio.to_thread(
+        service.delete_job,
+        job_name=job_name,
+        namespace=namespace
+    )
+    http_request.app.state.job_status_cache.invalidate((namespace, job_name))
+    return result
 
 
 @router.get(
@@ -229,13 +471,26 @@ async def delete_job(
     summary="Get Kubernetes Job Status",
     description="Retrieves the current status of a Kubernetes Job"
 )
+@eks_route("get_job_status", not_found="Job {job_name} not found in namespace {namespace}")
 async def get_job_status(
+    http_request: Request,
     job_name: str = Query(..., description="Name of the job"),
-    namespace: str = Query(default="default", description="Kubernetes namespace")
+    namespace: str = Query(default="default", description="Kubernetes namespace"),
+    service: EKSOperationsService = Depends(get_eks)
 ) -> Dict[str, Any]:
     """
     Get the status of a Kubernetes Job.
     
+    When the job status watcher is running, status for API-managed jobs is
+    served straight from its watch-fed in-memory view. Otherwise (or for
+    jobs the watcher does not know), responses are cached in memory for
+    JOB_STATUS_CACHE_TTL seconds per (namespace, job_name), so clients
+    polling the same job share a single Kubernetes API call; concurrent
+    cache misses for the same job are coalesced into one in-flight call as
+    well. If the API call fails with a non-404 error, the last cached status
+    is returned for up to JOB_STATUS_STALE_TTL seconds instead of an error
+    (stale-if-error).
+    
     Query parameters:
     - job_name (required): Name of the job
     - namespace (optional, default="default"): Namespace of the job
@@ -252,54 +507,279 @@ async def get_job_status(
     
     Log Output Example:
     - INFO: API request: get_job_status job=my-job namespace=default
-    - START: Fetching job status
+    - DEBUG: START Fetching job status
     - DEBUG: Job status state=Running active=2 succeeded=0 failed=0
-    - END: Job status retrieved duration=234ms
+    - DEBUG: END Job status retrieved
     """
-    request_id = str(uuid4())[:8]
-    set_request_id(request_id)
-    
-    try:
+    if INFO_ENABLED:
         logger.info(
-            f"API request: get_job_status job={job_name} namespace={namespace}",
-            extra={"request_id": request_id}
+            "API request: get_job_status job=%s namespace=%s",
+            job_name, namespace
+        )
+    
+    watcher = http_request.app.state.job_watcher
+    if watcher is not None:
+        watched = watcher.get(namespace, job_name)
+        if watched is not None:
+            logger.debug("Job status served from watch cache: job=%s namespace=%s", job_name, namespace)
+            return watched
+    
+    cache = http_request.app.state.job_status_cache
+    cache_key = (namespace, job_name)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        logger.debug("Job status cache hit: job=%s namespace=%s", job_name, namespace)
+        return cached
+    
+    async def fetch() -> Dict[str, Any]:
+        result = await asyncio.to_thread(
+            service.get_job_status,
+            job_name=job_name,
+            namespace=namespace
         )
-        
-        service = get_eks_service()
-        
-        with log_operation(logger, "get_job_status", job=job_name, namespace=namespace):
-            result = service.get_job_status(
-                job_name=job_name,
-                namespace=namespace
-            )
-        
         logger.debug(
-            f"Job status: {result.get('state')} "
-            f"(active={result.get('active')}, "
-            f"succeeded={result.get('succeeded')}, "
-            f"failed={result.get('failed')})"
+            "Job status: %s (active=%s, succeeded=%s, failed=%s)",
+            result.get('state'), result.get('active'),
+            result.get('succeeded'), result.get('failed')
         )
-        logger.info(f"Successfully retrieved status for job {job_name}")
+        cache.set(cache_key, result)
         return result
     
+    try:
+        # Concurrent polls for the same job share one in-flight API call
+        return await http_request.app.state.inflight.do(
+            ("get_job_status",) + cache_key, fetch
+        )
     except ApiException as e:
         if e.status == 404:
-            logger.warning(f"Job not found: {job_name} in namespace {namespace}")
-            raise HTTPException(
-                status_code=404,
-                detail=f"Job {job_name} not found in namespace {namespace}"
-            )
-        logger.error(f"Kubernetes API error fetching job status: {e.reason}", exc_info=True)
+            cache.invalidate(cache_key)
+            raise
+        stale = cache.get_stale(cache_key)
+        if stale is None:
+            raise
+        logger.warning(
+            "Serving stale status for job %s after API error: %s (status=%s)",
+            job_name, e.reason, e.status
+        )
+        return stale
+
+
+@router.get(
+    "/eks-get-jobs-status",
+    response_model=JobsStatusResponse,
+    summary="Get Status of several Kubernetes Jobs",
+    description="Retrieves the current status of several Kubernetes Jobs in one namespace with a single request"
+)
+@eks_route("get_jobs_status")
+async def get_jobs_status(
+    http_request: Request,
+    job_names: List[str] = Query(default=[], description="Names of the jobs (repeat the parameter)"),
+    namespace: str = Query(default="default", description="Kubernetes namespace"),
+    service: EKSOperationsService = Depends(get_eks)
+) -> Dict[str, Any]:
+    """
+    Get the status of several Kubernetes Jobs.
+    
+    Jobs known to the job status watcher are answered from its in-memory
+    view; the rest are fetched with one label-selector list request (see
+    EKSOperationsService.get_jobs_status) instead of one call per job.
+    
+    Query parameters:
+    - job_names (required, repeatable): Names of the jobs
+    - namespace (optional, default="default"): Namespace of the jobs
+    
+    Returns:
+    - jobs: Map of job name to its status (same fields as Get Job Status),
+      or null if the job was not found
+    """
+    if not job_names:
+        raise HTTPException(status_code=422, detail="job_names is required")
+    
+    if INFO_ENABLED:
+        logger.info(
+            "API request: get_jobs_status count=%d namespace=%s",
+            len(job_names), namespace
+        )
+    
+    statuses: Dict[str, Optional[Dict[str, Any]]] = {}
+    watcher = http_request.app.state.job_watcher
+    if watcher is not None:
+        for job_name in job_names:
+            watched = watcher.get(namespace, job_name)
+            if watched is not None:
+                statuses[job_name] = watched
+    
+    missing = [job_name for job_name in job_names if job_name not in statuses]
+    if missing:
+        statuses.update(await asyncio.to_thread(service.get_jobs_status, missing, namespace))
+    return {"jobs": {job_name: statuses[job_name] for job_name in job_names}}
+
+
+async def _job_status_stream(
+    watcher: JobStatusWatcher,
+    namespace: str,
+    job_name: str,
+    status: Dict[str, Any],
+    timeout_seconds: int
+) -> AsyncIterator[bytes]:
+    """
+    Encode a job's status changes from the job status watcher as newline-delimited JSON.
+    
+    Runs on the event loop: waiting for the next change is an await on the
+    subscription queue, so an open stream holds no thread. A client
+    disconnect cancels the generator, which drops the subscription.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout_seconds
+    queue = watcher.subscribe(namespace, job_name)
+    try:
+        # Subscribed first, so a change between the existence check and now is not missed
+        status = watcher.get(namespace, job_name) or status
+        last_status = None
+        while True:
+            if status != last_status:
+                yield orjson.dumps(status, option=orjson.OPT_APPEND_NEWLINE)
+                last_status = status
+            if status["state"] in TERMINAL_JOB_STATES:
+                return
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return
+            try:
+                status = await asyncio.wait_for(queue.get(), remaining)
+            except asyncio.TimeoutError:
+                return
+            if status is None:
+                # Job deleted or watcher stopped
+                return
+    finally:
+        watcher.unsubscribe(namespace, job_name, queue)
+
+
+@router.get(
+    "/eks-watch-job",
+    summary="Stream Kubernetes Job Status",
+    description="Streams status changes of a Kubernetes Job as newline-delimited JSON until it finishes",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}}}}
+)
+@eks_route("watch_job", not_found="Job {job_name} not found in namespace {namespace}")
+async def watch_job(
+    http_request: Request,
+    job_name: str = Query(..., description="Name of the job"),
+    namespace: str = Query(default="default", description="Kubernetes namespace"),
+    timeout_seconds: int = Query(default=300, ge=1, le=3600, description="Maximum time to keep the stream open"),
+    service: EKSOperationsService = Depends(get_eks)
+) -> Response:
+    """
+    Stream the status of a Kubernetes Job until it completes or fails.
+    
+    Instead of polling Get Job Status, clients keep one response open: each
+    line is a Get Job Status result (application/x-ndjson), sent when the
+    status changes. The first line is the current status; the stream ends
+    after a terminal state (completed / failed), when the job is deleted, or
+    after timeout_seconds.
+    
+    Updates come from the job status watcher's single watch over all
+    API-managed jobs (see JobStatusWatcher.subscribe), so an open stream
+    costs neither a Kubernetes watch nor a worker thread. Jobs not created
+    through this API (no app=eks-api label) only get their current status.
+    
+    Query parameters:
+    - job_name (required): Name of the job
+    - namespace (optional, default="default"): Namespace of the job
+    - timeout_seconds (optional, default=300, max 3600): Maximum stream duration
+    
+    Returns 404 if the job does not exist when the stream is requested, and
+    503 if the job status watcher is disabled.
+    """
+    watcher = http_request.app.state.job_watcher
+    if watcher is None:
         raise HTTPException(
-            status_code=e.status or 500,
-            detail=f"Kubernetes API error: {e.reason}"
+            status_code=503,
+            detail="Job status watcher is disabled (JOB_WATCH_ENABLED=false)"
         )
-    except Exception as e:
-        logger.error(f"Unexpected error fetching job status: {str(e)}", exc_info=True)
+    
+    if INFO_ENABLED:
+        logger.info(
+            "API request: watch_job job=%s namespace=%s timeout=%ss",
+            job_name, namespace, timeout_seconds
+        )
+    
+    # Fail with a proper 404 before the streaming response starts; jobs the
+    # watcher knows about are known to exist
+    status = watcher.get(namespace, job_name)
+    if status is None:
+        status = await asyncio.to_thread(service.get_job_status, job_name=job_name, namespace=namespace)
+    
+    # Content-Encoding is set so GZipMiddleware passes the stream through:
+    # it does not flush per chunk and would hold updates back.
+    return StreamingResponse(
+        _job_status_stream(watcher, namespace, job_name, status, timeout_seconds),
+        media_type="application/x-ndjson",
+        headers={"Content-Encoding": "identity", "Cache-Control": "no-cache"}
+    )
+
+
+@router.post(
+    "/eks-job-webhook",
+    response_model=SuccessResponse,
+    summary="Register a Job Completion Webhook",
+    description="Registers a URL that is notified when a Kubernetes Job completes or fails"
+)
+@eks_route(
+    "register_job_webhook",
+    not_found="Job {request.job_name} not found in namespace {request.namespace}"
+)
+async def register_job_webhook(
+    request: JobWebhookRequest,
+    http_request: Request,
+    service: EKSOperationsService = Depends(get_eks)
+) -> Dict[str, str]:
+    """
+    Register a completion webhook for an existing Kubernetes Job.
+    
+    Instead of polling /eks-get-job-status, callers can register a callback
+    URL. The job status watcher POSTs the final status (same body as
+    /eks-get-job-status) to the URL once the job completes or fails.
+    Delivery is retried with exponential backoff; each webhook fires once.
+    
+    Request body:
+    - job_name (required): Name of the job
+    - namespace (optional, default="default"): Namespace of the job
+    - callback_url (required): http(s) URL to notify; 422 if it is not
+      allowed (see WEBHOOK_ALLOWED_HOSTS)
+    
+    Returns:
+    - message: Confirmation message
+    - status: "success" on successful registration
+    """
+    watcher = http_request.app.state.job_watcher
+    if watcher is None:
         raise HTTPException(
-            status_code=500,
-            detail=f"Internal server error: {str(e)}"
+            status_code=503,
+            detail="Job status watcher is disabled (JOB_WATCH_ENABLED=false)"
+        )
+    _check_callback_url(request.callback_url)
+    
+    if INFO_ENABLED:
+        logger.info(
+            "API request: register_job_webhook job=%s namespace=%s",
+            request.job_name, request.namespace
         )
+    
+    # Make sure the job exists before accepting the registration
+    await asyncio.to_thread(
+        service.get_job_status,
+        job_name=request.job_name,
+        namespace=request.namespace
+    )
+    watcher.register_callback(request.namespace, request.job_name, request.callback_url)
+    
+    return {
+        "message": f"Webhook registered for job {request.job_name}",
+        "status": "success"
+    }
 
 
 # ============================================================================
@@ -312,7 +792,11 @@ async def get_job_status(
     summary="Create a Kubernetes Namespace",
     description="Creates a new Kubernetes Namespace in the EKS cluster"
 )
-async def create_namespace(request: NamespaceRequest) -> Dict[str, Any]:
+@eks_route("create_namespace")
+async def create_namespace(
+    request: NamespaceRequest,
+    service: EKSOperationsService = Depends(get_eks)
+) -> Dict[str, Any]:
     """
     Create a Kubernetes Namespace in the EKS cluster.
     
@@ -326,43 +810,20 @@ async def create_namespace(request: NamespaceRequest) -> Dict[str, Any]:
     
     Log Output Example:
     - INFO: API request: create_namespace namespace=my-ns
-    - START: Creating Kubernetes namespace
-    - END: Namespace created successfully duration=345ms
+    - DEBUG: START Creating Kubernetes namespace
+    - DEBUG: END Namespace created successfully
     """
-    request_id = str(uuid4())[:8]
-    set_request_id(request_id)
-    
-    try:
+    if INFO_ENABLED:
         logger.info(
-            f"API request: create_namespace namespace={request.namespace_name}",
-            extra={"request_id": request_id}
+            "API request: create_namespace namespace=%s",
+            request.namespace_name
         )
-        
-        service = get_eks_service()
-        
-        with log_operation(logger, "create_namespace", namespace=request.namespace_name):
-            result = service.create_namespace(
-                namespace_name=request.namespace_name
-            )
-        
-        logger.info(f"Successfully created namespace {request.namespace_name}")
-        return result
     
-    except ApiException as e:
-        logger.error(
-            f"Kubernetes API error creating namespace: {e.reason}",
-            exc_info=True
-        )
-        raise HTTPException(
-            status_code=e.status or 500,
-            detail=f"Kubernetes API error: {e.reason}"
-        )
-    except Exception as e:
-        logger.error(f"Unexpected error creating namespace: {str(e)}", exc_info=True)
-        raise HTTPException(
-            status_code=500,
-            detail=f"Internal server error: {str(e)}"
-        )
+    result = await asyncio.to_thread(
+        service.create_namespace,
+        namespace_name=request.namespace_name
+    )
+    return result
 
 
 @router.delete(
@@ -371,8 +832,10 @@ async def create_namespace(request: NamespaceRequest) -> Dict[str, Any]:
     summary="Delete a Kubernetes Namespace",
     description="Deletes a Kubernetes Namespace from the EKS cluster"
 )
+@eks_route("delete_namespace", not_found="Namespace {namespace_name} not found")
 async def delete_namespace(
-    namespace_name: str = Query(..., description="Name of the namespace to delete")
+    namespace_name: str = Query(..., description="Name of the namespace to delete"),
+    service: EKSOperationsService = Depends(get_eks)
 ) -> Dict[str, str]:
     """
     Delete a Kubernetes Namespace from the EKS cluster.
@@ -386,43 +849,17 @@ async def delete_namespace(
     
     Log Output Example:
     - INFO: API request: delete_namespace namespace=my-ns
-    - START: Deleting Kubernetes namespace
-    - END: Namespace deleted successfully duration=789ms
+    - DEBUG: START Deleting Kubernetes namespace
+    - DEBUG: END Namespace deleted successfully
     """
-    request_id = str(uuid4())[:8]
-    set_request_id(request_id)
-    
-    try:
+    if INFO_ENABLED:
         logger.info(
-            f"API request: delete_namespace namespace={namespace_name}",
-            extra={"request_id": request_id}
+            "API request: delete_namespace namespace=%s",
+            namespace_name
         )
-        
-        service = get_eks_service()
-        
-        with log_operation(logger, "delete_namespace", namespace=namespace_name):
-            result = service.delete_namespace(
-                namespace_name=namespace_name
-            )
-        
-        logger.info(f"Successfully deleted namespace {namespace_name}")
-        return result
     
-    except ApiException as e:
-        if e.status == 404:
-            logger.warning(f"Namespace not found: {namespace_name}")
-            raise HTTPException(
-                status_code=404,
-                detail=f"Namespace {namespace_name} not found"
-            )
-        logger.error(f"Kubernetes API error deleting namespace: {e.reason}", exc_info=True)
-        raise HTTPException(
-            status_code=e.status or 500,
-            detail=f"Kubernetes API error: {e.reason}"
-        )
-    except Exception as e:
-        logger.error(f"Unexpected error deleting namespace: {str(e)}", exc_info=True)
-        raise HTTPException(
-            status_code=500,
-            detail=f"Internal server error: {str(e)}"
-        )
+    result = await asyncio.to_thread(
+        service.delete_namespace,
+        namespace_name=namespace_name
+    )
+    return result
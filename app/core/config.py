@@ -3,34 +3,32 @@ Configuration management for the EKS API application.
 Loads configuration from environment variables and .env files.
 """
 import os
+from functools import lru_cache
 from pathlib import Path
 from pydantic_settings import BaseSettings
 from typing import Optional
-from dotenv import load_dotenv
+from dotenv import dotenv_values
 
-# Load .env file if it exists
-# Look for .env in the project root and parent directories
-env_paths = [
-    Path.cwd() / ".env",
+# .env files read by Settings, lowest priority first: the project root, then
+# the current working directory. Missing files are skipped.
+ENV_FILES = (
     Path(__file__).parent.parent.parent / ".env",
-]
+    Path(".env"),
+)
 
-for env_path in env_paths:
-    if env_path.exists():
-        print(f"[CONFIG] Loading environment from: {env_path}")
-        load_dotenv(env_path, override=True)
-        break
-else:
-    print("[CONFIG] No .env file found. Using system environment variables.")
+# Variables from .env that are read directly by boto3 / eks-token rather than
+# through Settings, and therefore have to be exported to the process environment
+AWS_ENV_PREFIX = "AWS_"
 
 
 class Settings(BaseSettings):
     """
     Application settings loaded from environment variables and .env files.
     Priority order:
-    1. Environment variables (loaded from .env)
-    2. System environment variables
-    3. Default values
+    1. System environment variables
+    2. .env in the current working directory
+    3. .env in the project root
+    4. Default values
     
     Required environment variables:
     - EKS_CLUSTER_NAME: Name of the EKS cluster
@@ -42,18 +40,124 @@ class Settings(BaseSettings):
     - AWS CLI configuration (~/.aws/credentials, ~/.aws/config)
     """
     
-    eks_cluster_name: str = os.getenv("EKS_CLUSTER_NAME", "")
-    eks_region: str = os.getenv("EKS_REGION", "us-east-1")
-    log_level: str = os.getenv("LOG_LEVEL", "INFO")
+    eks_cluster_name: str = ""
+    eks_region: str = "us-east-1"
+    log_level: str = "INFO"
+    
+    # Job status cache (seconds). Identical status polls within the TTL are
+    # served from memory; on Kubernetes API errors the last value is served
+    # for up to JOB_STATUS_STALE_TTL additional seconds.
+    job_status_cache_ttl: float = 5.0
+    job_status_stale_ttl: float = 60.0
+    
+    # Watch-backed job status cache. When enabled, one watch stream over all
+    # API-managed jobs keeps status in memory and status polls are answered
+    # without calling the Kubernetes API (requires list/watch on jobs).
+    job_watch_enabled: bool = True
+    
+    # Hosts that completion webhooks (callback_url) may be sent to,
+    # comma-separated; an entry starting with "." also matches subdomains
+    # (".example.com"). Webhooks are POSTed from inside the VPC, so set this
+    # in production. Empty allows any host except loopback, link-local
+    # (e.g. the instance metadata endpoint) and other reserved IP addresses.
+    webhook_allowed_hosts: str = ""
+    
+    # Maximum number of keep-alive connections to the Kubernetes API server.
+    # Route handlers call the Kubernetes client from worker threads, so this
+    # should be at least the number of concurrent calls; connections beyond
+    # the pool size are opened per request and discarded afterwards. The
+    # effective size is never below worker_threads.
+    k8s_connection_pool_maxsize: int = 32
+    
+    # Maximum number of jobs accepted by one batch create request
+    # (/api/eks-create-jobs); larger batches are rejected with 422.
+    create_jobs_max_batch: int = 100
+    
+    # Send Kubernetes API calls through a local `kubectl proxy` (e.g. a
+    # sidecar container) instead of straight to the EKS endpoint. The proxy
+    # handles authentication, so no IAM token, describe_cluster call or
+    # cluster CA is needed; traffic is plain HTTP on localhost.
+    use_local_proxy: bool = False
+    local_proxy_url: str = "http://127.0.0.1:8001"
+    
+    # Directory for the on-disk describe_cluster cache (endpoint + CA data),
+    # so restarted processes and new pods skip the EKS API call on startup.
+    # Set to an empty value to disable.
+    cluster_info_cache_dir: str = str(Path.home() / ".cache" / "eks_ops")
+    
+    # Threads available for blocking Kubernetes/AWS calls offloaded from the
+    # event loop (asyncio.to_thread). Python's default is min(32, CPUs + 4),
+    # which caps concurrent Kubernetes calls at 5-8 threads on small nodes.
+    worker_threads: int = 32
+    
+    # Number of uvicorn worker processes when started via `python -m app.main`
+    # (WEB_CONCURRENCY). Defaults to 1, like uvicorn: the work is I/O-bound
+    # and runs on worker_threads, so scale out with pod replicas instead.
+    # Each worker process has its own EKS client, token refresher, thread
+    # pool, connection pool and cluster-wide job watch (one LIST/WATCH per
+    # worker), and its own Prometheus metrics, so /metrics only reports the
+    # worker that answered the scrape.
+    web_concurrency: int = 1
+    
+    # Comma-separated list of origins allowed to call the API from a browser
+    # (ALLOWED_ORIGINS). An explicit list is required because credentials are
+    # allowed, which is invalid with a wildcard origin.
+    allowed_origins: str = "http://localhost:3000"
+    
+    # uvicorn server options for `python -m app.main`. Per-request access log
+    # lines are off by default (errors are logged by the routes). Client IP
+    # and scheme are taken from X-Forwarded-For/-Proto only when sent by
+    # forwarded_allow_ips (comma-separated IPs/CIDRs); the default trusts
+    # localhost only, as uvicorn does. List the load balancer subnets
+    # explicitly; "*" lets any client spoof its address.
+    access_log: bool = False
+    forwarded_allow_ips: str = "127.0.0.1"
+    # Keep-alive above typical load balancer idle timeouts (60s) so pooled
+    # connections are not torn down mid-reuse; beyond limit_concurrency
+    # concurrent connections/requests uvicorn answers 503 immediately.
+    # limit_max_requests recycles a worker after N requests; leave it unset
+    # with multiple workers, as uvicorn's own supervisor does not restart them.
+    timeout_keep_alive: int = 75
+    limit_concurrency: Optional[int] = 1000
+    limit_max_requests: Optional[int] = None
+    backlog: int = 2048
     
     class Config:
         case_sensitive = False
-        env_file = ".env"
+        env_file = ENV_FILES
         env_file_encoding = "utf-8"
+        extra = "ignore"
+
+
+def _export_aws_env() -> None:
+    """
+    Export AWS_* variables from the .env files to the process environment.
+    
+    The AWS SDK resolves credentials from os.environ only. Variables already
+    set in the environment are never overridden.
+    """
+    for env_file in reversed(ENV_FILES):
+        if not env_file.is_file():
+            continue
+        for key, value in dotenv_values(env_file).items():
+            if key.upper().startswith(AWS_ENV_PREFIX) and value is not None:
+                os.environ.setdefault(key, value)
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Build the application settings once per process.
+    
+    pydantic-settings parses the .env files itself; subsequent calls return
+    the same Settings instance.
+    """
+    _export_aws_env()
+    return Settings()
 
 
 # Global settings instance
-settings = Settings()
+settings = get_settings()
 
 
 def validate_settings() -> None:
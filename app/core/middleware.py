@@ -0,0 +1,101 @@
+"""
+ASGI middleware for the EKS API application.
+"""
+from typing import Dict
+from uuid import uuid4
+
+from app.utils.logger import set_request_id, reset_request_id
+
+REQUEST_ID_HEADER = b"x-request-id"
+MAX_REQUEST_ID_LENGTH = 64
+
+
+class RequestIDMiddleware:
+    """
+    Assigns a request ID to every HTTP request for log correlation.
+    
+    The ID is taken from the incoming X-Request-ID header when present,
+    otherwise a new short ID is generated. It is stored in the request_id
+    ContextVar for the duration of the request (so every log line emitted
+    while handling it carries the ID) and echoed back as X-Request-ID.
+    
+    Implemented as a plain ASGI middleware rather than BaseHTTPMiddleware
+    to avoid the extra task and response streaming wrapper per request.
+    """
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == REQUEST_ID_HEADER:
+                request_id = value.decode("latin-1")[:MAX_REQUEST_ID_LENGTH]
+                break
+        if not request_id:
+            request_id = uuid4().hex[:8]
+        
+        async def send_with_request_id(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((REQUEST_ID_HEADER, request_id.encode("latin-1")))
+                message["headers"] = headers
+            await send(message)
+        
+        token = set_request_id(request_id)
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            reset_request_id(token)
+
+
+class StaticProbeMiddleware:
+    """
+    Answers GET/HEAD requests for fixed paths with pre-serialized JSON bodies.
+    
+    Added as the outermost middleware, so liveness probes are answered with
+    two send() calls and never reach CORS handling, request ID assignment,
+    exception middleware or the router. All other requests are passed
+    through unchanged.
+    """
+    
+    def __init__(self, app, responses: Dict[str, bytes]):
+        """
+        Args:
+            app: Wrapped ASGI application
+            responses: Map of request path to the JSON body returned for it
+        """
+        self.app = app
+        self.responses = {
+            path: (
+                {
+                    "type": "http.response.start",
+                    "status": 200,
+                    "headers": [
+                        (b"content-type", b"application/json"),
+                        (b"content-length", str(len(body)).encode("latin-1")),
+                    ],
+                },
+                body,
+            )
+            for path, body in responses.items()
+        }
+    
+    async def __call__(self, scope, receive, send):
+        response = None
+        if scope["type"] == "http" and scope["method"] in ("GET", "HEAD"):
+            response = self.responses.get(scope["path"])
+        if response is None:
+            await self.app(scope, receive, send)
+            return
+        
+        start_message, body = response
+        await send(start_message)
+        await send({
+            "type": "http.response.body",
+            "body": body if scope["method"] == "GET" else b"",
+        })
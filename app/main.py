@@ -11,109 +11,322 @@ Authentication Model:
 Run with:
     uvicorn app.main:app --host 0.0.0.0 --port 8000
 """
+import asyncio
+import logging
 import sys
-from fastapi import FastAPI
+from concurrent.futures import ThreadPoolExecutor
+import orjson
+from fastapi import FastAPI, Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
+from fastapi.utils import is_body_allowed_for_status_code
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from prometheus_client import make_asgi_app
 from contextlib import asynccontextmanager
+from typing import Any, Dict, List
+from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from app.api.routes import router
 from app.core.config import settings, validate_settings
+from app.core.middleware import RequestIDMiddleware, StaticProbeMiddleware
+from app.services.eks_operations import get_eks_service, reset_eks_service
+from app.services.job_watcher import JobStatusWatcher
+from app.utils.cache import SingleFlight, TTLCache
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__, settings.log_level)
 
+# Seconds a readiness result is reused, so probes from every replica do not
+# turn into a steady stream of Kubernetes API calls
+READINESS_CACHE_TTL = 10.0
+
+
+def _unresolved_refs(schema: Dict[str, Any]) -> List[str]:
+    """Return the "$ref" values in an OpenAPI document that do not point to an existing node."""
+    unresolved = []
+    
+    def resolves(ref: str) -> bool:
+        if not ref.startswith("#/"):
+            return False
+        node: Any = schema
+        for part in ref[2:].split("/"):
+            if not isinstance(node, dict) or part not in node:
+                return False
+            node = node[part]
+        return True
+    
+    def walk(node: Any) -> None:
+        if isinstance(node, dict):
+            ref = node.get("$ref")
+            if isinstance(ref, str) and not resolves(ref):
+                unresolved.append(ref)
+            for value in node.values():
+                walk(value)
+        elif isinstance(node, list):
+            for item in node:
+                walk(item)
+    
+    walk(schema)
+    return unresolved
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
     Application lifespan context manager.
     Validates configuration on startup and initializes services.
+    
+    The EKS operations service (boto3 client, bearer token and Kubernetes
+    ApiClient with its connection pool) is created exactly once here and
+    stored on app.state.eks, so request handlers reuse it instead of
+    constructing clients on the hot path. Creating it does no I/O; a
+    background warm-up task then configures the clients (describe_cluster,
+    token) and calls /version, so startup does not wait on AWS and the first
+    request usually finds the service ready. The service is closed again on
+    shutdown.
     """
     # Startup
     try:
-        logger.info("=" * 80)
-        logger.info("EKS Kubernetes Operations API - Startup")
-        logger.info("=" * 80)
-        
-        logger.info(f"Python version: {sys.version.split()[0]}")
-        logger.info(f"Application version: 1.0.0")
+        logger.info(
+            "EKS Kubernetes Operations API starting (version=1.0.0 python=%s)",
+            sys.version.split()[0]
+        )
         
-        logger.info("Validating configuration...")
         validate_settings()
         
-        logger.info(f"Configuration loaded successfully:")
-        logger.info(f"  - EKS Cluster: {settings.eks_cluster_name}")
-        logger.info(f"  - AWS Region: {settings.eks_region}")
-        logger.info(f"  - Log Level: {settings.log_level}")
+        # Sized executor for asyncio.to_thread (all blocking client calls)
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=settings.worker_threads, thread_name_prefix="eks-worker")
+        )
+        logger.info(
+            "Configuration loaded: cluster=%s region=%s log_level=%s",
+            settings.eks_cluster_name, settings.eks_region, settings.log_level
+        )
         
-        logger.info("Starting FastAPI application...")
-        logger.info("Application startup completed successfully")
-        logger.info("Ready to accept requests")
-        logger.info("=" * 80)
+        app.state.eks = get_eks_service()
+        app.state.job_status_cache = TTLCache(
+            ttl=settings.job_status_cache_ttl,
+            stale_ttl=settings.job_status_stale_ttl
+        )
+        app.state.inflight = SingleFlight()
+        app.state.readiness_cache = TTLCache(ttl=READINESS_CACHE_TTL)
         
-    except Exception as e:
-        logger.error("=" * 80)
-        logger.error(f"Configuration validation failed: {str(e)}", exc_info=True)
-        logger.error("=" * 80)
+        # Warm-up in the background: configure the clients and open the first
+        # pooled TLS connection to the Kubernetes API server (DNS, TCP and TLS
+        # handshake) before the first request needs them; also seeds the
+        # /readyz result. Failures are logged only.
+        app.state.warmup = asyncio.create_task(
+            app.state.inflight.do(("readyz",), lambda: _check_ready(app))
+        )
+        
+        app.state.job_watcher = None
+        if settings.job_watch_enabled:
+            app.state.job_watcher = JobStatusWatcher(app.state.eks)
+            app.state.job_watcher.start()
+        
+        # Build the OpenAPI schema now (FastAPI caches it on app.openapi_schema)
+        # instead of on the first /docs or /openapi.json request
+        unresolved = _unresolved_refs(app.openapi())
+        assert not unresolved, f"Unresolvable $ref in OpenAPI schema: {unresolved}"
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Job status cache: ttl=%ss stale_if_error=%ss; job status watcher: %s",
+                settings.job_status_cache_ttl, settings.job_status_stale_ttl,
+                "enabled" if settings.job_watch_enabled else "disabled"
+            )
+            logger.debug("OpenAPI schema built (%d paths)", len(app.openapi_schema["paths"]))
+            logger.debug("Worker threads for blocking calls: %d", settings.worker_threads)
+        logger.info("Application startup completed, ready to accept requests")
+        
+    except ValueError as e:
+        # Invalid configuration: fail fast without a traceback; uvicorn
+        # aborts startup and exits non-zero, so the pod restarts with backoff
+        logger.error("Configuration invalid: %s", e)
         raise
     
     yield
     
     # Shutdown
-    logger.info("=" * 80)
-    logger.info("EKS Kubernetes Operations API - Shutdown")
-    logger.info("Gracefully shutting down application...")
-    logger.info("=" * 80)
+    logger.info("EKS Kubernetes Operations API shutting down")
+    app.state.warmup.cancel()
+    if app.state.job_watcher is not None:
+        app.state.job_watcher.stop()
+    app.state.eks.close()
+    reset_eks_service()
+    logger.info("Shutdown complete")
 
 
 # Create FastAPI application
+# Responses are serialized with orjson (ORJSONResponse) instead of stdlib json
 app = FastAPI(
     title="EKS Kubernetes Operations API",
     description="Production-ready API for managing Kubernetes Jobs and Namespaces in AWS EKS clusters",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
 
+# Error responses (HTTPException, request validation) are serialized with
+# orjson as well; FastAPI's built-in handlers always use stdlib JSONResponse
+@app.exception_handler(StarletteHTTPException)
+async def http_exception_handler(request: Request, exc: StarletteHTTPException) -> Response:
+    headers = getattr(exc, "headers", None)
+    if not is_body_allowed_for_status_code(exc.status_code):
+        return Response(status_code=exc.status_code, headers=headers)
+    return ORJSONResponse({"detail": exc.detail}, status_code=exc.status_code, headers=headers)
+
+
+@app.exception_handler(RequestValidationError)
+async def validation_exception_handler(request: Request, exc: RequestValidationError) -> Response:
+    return ORJSONResponse({"detail": jsonable_encoder(exc.errors())}, status_code=422)
+
+
+# Compress larger responses (e.g. /metrics, OpenAPI schema) for clients
+# that accept gzip; small JSON bodies are sent as-is
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+
 # Configure CORS middleware
+# Explicit origins, methods and headers: Starlette precomputes the static CORS
+# headers once instead of reflecting the request's Origin/headers every time
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=[origin.strip() for origin in settings.allowed_origins.split(",") if origin.strip()],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "DELETE"],
+    allow_headers=["authorization", "content-type", "x-request-id"],
+    # Let browsers cache preflight results for an hour
+    max_age=3600,
 )
 
 
+# Assign a request ID to every request for log correlation
+app.add_middleware(RequestIDMiddleware)
+
+
 # Include API routes
 app.include_router(router)
 
 
-# Health check endpoint
+# Prometheus metrics (operation duration histograms)
+app.mount("/metrics", make_asgi_app())
+
+
+# Health check endpoints
+# The bodies never change for the lifetime of the process, so they are
+# serialized once instead of on every probe
+_HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "cluster": settings.eks_cluster_name,
+    "region": settings.eks_region
+})
+_LIVE_BODY = orjson.dumps({"status": "alive"})
+_READY_BODY = orjson.dumps({"status": "ready"})
+_NOT_READY_BODY = orjson.dumps({"status": "not ready"})
+
+
 @app.get(
     "/health",
     summary="Health Check",
-    description="Simple health check endpoint"
+    description="Simple health check endpoint",
+    response_class=Response
 )
-async def health_check() -> dict:
+async def health_check() -> Response:
     """
     Health check endpoint.
     Returns status and cluster information.
+    
+    GET/HEAD requests are answered by StaticProbeMiddleware before they reach
+    the router; this route documents the endpoint in the OpenAPI schema.
+    """
+    return Response(content=_HEALTH_BODY, media_type="application/json")
+
+
+@app.get(
+    "/livez",
+    summary="Liveness Probe",
+    description="Constant response without any I/O; use as the Kubernetes liveness probe",
+    response_class=Response
+)
+async def liveness_check() -> Response:
+    """
+    Liveness probe endpoint.
+    
+    Answered by StaticProbeMiddleware like /health; this route documents the
+    endpoint in the OpenAPI schema.
+    """
+    return Response(content=_LIVE_BODY, media_type="application/json")
+
+
+async def _check_ready(app: FastAPI) -> bool:
+    """Check Kubernetes API connectivity and cache the result."""
+    try:
+        await asyncio.to_thread(app.state.eks.check_connectivity)
+        ready = True
+    except Exception as e:
+        logger.warning("Readiness check failed: %s", e)
+        ready = False
+    app.state.readiness_cache.set("ready", ready)
+    return ready
+
+
+@app.get(
+    "/readyz",
+    summary="Readiness Probe",
+    description="Checks Kubernetes API connectivity (cached); use as the Kubernetes readiness probe",
+    response_class=Response
+)
+async def readiness_check(request: Request) -> Response:
     """
-    return {
-        "status": "healthy",
-        "cluster": settings.eks_cluster_name,
-        "region": settings.eks_region
-    }
+    Readiness probe endpoint.
+    
+    Returns 200 when the Kubernetes API server is reachable, 503 otherwise.
+    The result (success or failure) is cached for READINESS_CACHE_TTL
+    seconds and concurrent probes share a single check.
+    """
+    ready = request.app.state.readiness_cache.get("ready")
+    if ready is None:
+        ready = await request.app.state.inflight.do(("readyz",), lambda: _check_ready(request.app))
+    if ready:
+        return Response(content=_READY_BODY, media_type="application/json")
+    return Response(content=_NOT_READY_BODY, status_code=503, media_type="application/json")
+
+
+# Outermost middleware: answer /health and /livez probes before the rest of the stack
+app.add_middleware(
+    StaticProbeMiddleware,
+    responses={"/health": _HEALTH_BODY, "/livez": _LIVE_BODY}
+)
 
 
 if __name__ == "__main__":
     import uvicorn
     
-    logger.info("Starting uvicorn server")
+    logger.info("Starting uvicorn server with %d worker(s)", settings.web_concurrency)
+    # uvloop event loop and httptools HTTP parser (both installed with
+    # uvicorn[standard]); pinned explicitly so a missing extra fails at
+    # startup instead of silently falling back to the pure-Python stack.
+    # Multiple workers require the app as an import string; startup work
+    # runs per worker in lifespan.
     uvicorn.run(
-        app,
+        "app.main:app",
         host="0.0.0.0",
         port=8000,
-        log_level=settings.log_level.lower()
+        workers=settings.web_concurrency,
+        log_level=settings.log_level.lower(),
+        loop="uvloop",
+        http="httptools",
+        access_log=settings.access_log,
+        proxy_headers=True,
+        forwarded_allow_ips=settings.forwarded_allow_ips,
+        server_header=False,
+        date_header=False,
+        timeout_keep_alive=settings.timeout_keep_alive,
+        limit_concurrency=settings.limit_concurrency,
+        limit_max_requests=settings.limit_max_requests,
+        backlog=settings.backlog
     )
@@ -6,45 +6,763 @@ Authentication Flow:
 2. Generate short-lived IAM bearer token using eks-token package
 3. Configure kubernetes.client.Configuration with:
    - host (cluster endpoint)
-   - ssl_ca_cert (decoded CA certificate)
-   - authorization (Bearer token)
-4. All Kubernetes API calls use this authenticated client
+   - an in-memory SSL context trusting the decoded CA certificate
+   - Authorization header (Bearer token) on the ApiClient
+4. All Kubernetes API calls use this authenticated client; the token is
+   cached (TokenCache) and set as the client's default Authorization
+   header, swapped before expiry by a background refresher thread (with
+   ensure_ready() as the fallback)
 
 No kubeconfig files are used. IAM-based authentication is mandatory.
 """
 import base64
 import boto3
-from typing import Dict, Any, Optional, Tuple
-from datetime import datetime
-from kubernetes import client, config
+from botocore.config import Config
+import json
+import logging
+import operator
+import os
+import random
+import re
+import orjson
+import ssl
+import threading
+import time
+import urllib3
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache, partial
+from pathlib import Path
+from urllib.parse import urlencode
+from typing import Callable, Dict, Any, Iterator, List, Optional, Tuple
+from kubernetes import client, watch
+from kubernetes.client import rest
 from kubernetes.client.rest import ApiException
 from eks_token import get_token
-import ssl
+from eks_token import logics as eks_token_logics
 
-from app.utils.logger import get_logger
+from app.utils.cache import TTLCache
+from app.utils.logger import get_logger, log_operation
 from app.core.config import settings
 
 logger = get_logger(__name__, settings.log_level)
+# The log level is fixed at startup, so per-request DEBUG logs check this
+# flag instead of going through the logging level machinery
+DEBUG_ENABLED = logger.isEnabledFor(logging.DEBUG)
+
+# describe_cluster results shared by every service instance in the process,
+# keyed by (cluster name, region). Endpoint and CA data rarely change, so a
+# rebuilt service reuses them instead of calling the EKS API again; use
+# EKSOperationsService.invalidate_cluster_info() to force a refresh (done
+# automatically when the API server is unreachable or fails TLS verification).
+CLUSTER_INFO_TTL_SECONDS = 3600
+_cluster_info_cache = TTLCache(ttl=CLUSTER_INFO_TTL_SECONDS, maxsize=8)
+# Serializes describe_cluster so concurrent service builds share one call
+_cluster_info_lock = threading.Lock()
+
+# AWS SDK clients (describe_cluster, credential check): adaptive client-side
+# retries for throttling and keep-alive on the pooled HTTPS connections
+_AWS_CLIENT_CONFIG = Config(retries={"mode": "adaptive", "max_attempts": 5}, tcp_keepalive=True)
+_boto_session_lock = threading.Lock()
+
+# Minimum seconds between cluster info revalidations triggered by TLS or
+# connection failures (see EKSOperationsService.check_connectivity)
+CLUSTER_INFO_REVALIDATE_SECONDS = 60
+
+# On-disk copy of the describe_cluster result (settings.cluster_info_cache_dir),
+# used by new processes. Entries older than the max age are ignored; entries
+# older than the refresh age are used but refreshed in the background.
+CLUSTER_INFO_DISK_MAX_AGE_SECONDS = 24 * 3600
+CLUSTER_INFO_DISK_REFRESH_AGE_SECONDS = 3600
+
+# Job states after which a job will not change anymore
+TERMINAL_JOB_STATES = ("completed", "failed")
+
+# Constant parts of the Job and Namespace bodies; merged with the
+# per-object metadata (and job spec), never mutated
+_JOB_TEMPLATE = {"apiVersion": "batch/v1", "kind": "Job"}
+_JOB_LABELS = {"app": "eks-api"}
+_NAMESPACE_TEMPLATE = {"apiVersion": "v1", "kind": "Namespace"}
+
+# Delete options for jobs and namespaces (dependents are deleted first);
+# shared by all delete calls, serialization does not modify it
+_DELETE_FOREGROUND = client.V1DeleteOptions(propagation_policy='Foreground')
+
+# Job names per get_jobs_status list request (keeps the label selector, and
+# so the request URL, bounded); names must be valid label values to match
+JOB_ID_SELECTOR_CHUNK = 100
+_LABEL_VALUE_RE = re.compile(r"(?:[A-Za-z0-9](?:[-A-Za-z0-9_.]{0,61}[A-Za-z0-9])?)")
+
+# Seconds a namespace seen to exist is assumed to still exist, so create_jobs
+# skips the read_namespace pre-check
+NAMESPACE_CACHE_TTL_SECONDS = 300
+
+
+def format_job_status(job: client.V1Job) -> Dict[str, Any]:
+    """
+    Build the job status response for a V1Job object.
+    
+    Shared by the request path (get_job_status) and the watch-backed
+    status cache so both report identical state.
+    
+    State is derived from the pod counters, in priority order:
+    - completed: at least one pod succeeded
+    - failed: at least one pod failed
+    - running: at least one pod is active
+    - unknown: none of the above (e.g. job just created)
+    
+    Args:
+        job: Job object returned by the Kubernetes API
+    
+    Returns:
+        Dict with job state, active/succeeded/failed counts, and timestamps
+        (datetime or None; serialized to ISO 8601 by orjson)
+    """
+    metadata = job.metadata
+    status = job.status
+    active = status.active or 0
+    succeeded = status.succeeded or 0
+    failed = status.failed or 0
+    return {
+        "job_name": metadata.name,
+        "namespace": metadata.namespace,
+        "state": _job_state(active, succeeded, failed),
+        "active": active,
+        "succeeded": succeeded,
+        "failed": failed,
+        "start_time": status.start_time,
+        "completion_time": status.completion_time
+    }
+
+
+def format_raw_job_status(job: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build the same job status response as format_job_status from a raw Job.
+    
+    Takes the Job as decoded JSON (a plain dict) instead of a V1Job, so the
+    caller can skip deserializing the full object (spec, pod template,
+    managed fields) into model classes when only the status is needed.
+    """
+    metadata = job["metadata"]
+    status = job.get("status") or {}
+    active = status.get("active")
+    succeeded = status.get("succeeded")
+    failed = status.get("failed")
+    return {
+        "job_name": metadata["name"],
+        "namespace": metadata["namespace"],
+        "state": _job_state(active, succeeded, failed),
+        "active": active or 0,
+        "succeeded": succeeded or 0,
+        "failed": failed or 0,
+        "start_time": _parse_k8s_time(status.get("startTime")),
+        "completion_time": _parse_k8s_time(status.get("completionTime"))
+    }
+
+
+def _job_state(active: Optional[int], succeeded: Optional[int], failed: Optional[int]) -> str:
+    """Derive the job state from its pod counters (see format_job_status)."""
+    if succeeded and succeeded > 0:
+        return "completed"
+    if failed and failed > 0:
+        return "failed"
+    if active and active > 0:
+        return "running"
+    return "unknown"
+
+
+def _parse_k8s_time(value: Optional[str]) -> Optional[datetime]:
+    """Parse an RFC 3339 timestamp from a raw Kubernetes object ('2026-01-21T10:30:00Z')."""
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+@lru_cache(maxsize=1)
+def _get_boto_session() -> boto3.Session:
+    """
+    Get the boto3 Session shared by all AWS clients of the process.
+    
+    Wraps the botocore session eks-token presigns its STS requests with, so
+    describe_cluster, the credential check and token generation resolve
+    credentials (e.g. the instance metadata lookup) once and share the
+    cached result.
+    """
+    return boto3.Session(botocore_session=getattr(eks_token_logics, "work_session", None))
+
+
+@lru_cache(maxsize=8)
+def _get_aws_client(service_name: str, region: str):
+    """
+    Get a boto3 client for a service and region, created once per process.
+    
+    Clients come from the shared session with adaptive retries and TCP
+    keep-alive (_AWS_CLIENT_CONFIG). Creating clients from one session is
+    not thread-safe, hence the lock; the clients themselves are.
+    """
+    with _boto_session_lock:
+        return _get_boto_session().client(service_name, region_name=region, config=_AWS_CLIENT_CONFIG)
+
+
+def _get_eks_client(region: str):
+    """
+    Get the boto3 EKS client for a region, created once per process.
+    
+    Building a boto3 client loads the service model and endpoint rules, so
+    every service instance shares one client per region (boto3 clients are
+    thread-safe).
+    
+    AWS credentials are resolved automatically from (first match wins):
+    1. Environment variables: AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY
+    2. Shared credential file: ~/.aws/credentials
+    3. Shared config file: ~/.aws/config
+    4. EC2 instance metadata (IAM role) ← RECOMMENDED
+    5. Container credentials (ECS/EKS)
+    
+    Raises:
+        botocore.exceptions.NoCredentialsError: If no credentials found
+        botocore.exceptions.ClientError: If credentials invalid
+    """
+    logger.debug("Creating boto3 EKS client for region: %s", region)
+    
+    # Create client without explicit credentials (use credential chain)
+    # This allows boto3 to automatically discover EC2 instance role credentials
+    return _get_aws_client('eks', region)
+
+
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+
+def _is_plain_json(obj: Any) -> bool:
+    """True if obj only contains dicts, lists/tuples and JSON scalars (no models or datetimes)."""
+    if isinstance(obj, _JSON_SCALARS):
+        return True
+    if isinstance(obj, dict):
+        return all(_is_plain_json(value) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return all(_is_plain_json(item) for item in obj)
+    return False
+
+
+def _fast_sanitize(sanitize: Callable[[Any], Any], obj: Any) -> Any:
+    """
+    ApiClient.sanitize_for_serialization with an early-out for plain data.
+    
+    The stock method rebuilds every nested dict and list of a request body
+    (job manifests are plain dicts already); plain data is returned as-is
+    and only models/datetimes go through the original conversion.
+    """
+    if _is_plain_json(obj):
+        return obj
+    return sanitize(obj)
+
+
+def _is_endpoint_error(e: BaseException) -> bool:
+    """
+    True if a Kubernetes call failed to reach or verify the API server.
+    
+    Covers TLS errors (e.g. certificate verification against a stale CA)
+    and failures to connect (DNS, connection refused, connect timeout),
+    raised directly, as the MaxRetryError of the pool's retries, or as the
+    status-0 ApiException the REST client wraps SSL errors in.
+    """
+    if isinstance(e, urllib3.exceptions.MaxRetryError):
+        e = e.reason
+    if isinstance(e, ApiException):
+        return e.status == 0
+    return isinstance(e, (urllib3.exceptions.SSLError, urllib3.exceptions.ConnectTimeoutError))
+
+
+def _select_json(select: Callable[[List[str]], Optional[str]], offered: List[str]) -> Optional[str]:
+    """
+    Accept / Content-Type selector with a fast path for JSON.
+    
+    Returns 'application/json' when the operation offers it (every call made
+    by this service) without the stock method's lowercasing pass; anything
+    else, e.g. the patch content types of PATCH calls made through
+    api_client, goes to the stock selector.
+    """
+    if offered and 'application/json' in offered:
+        return 'application/json'
+    return select(offered)
+
+
+def _is_namespace_missing(e: ApiException, namespace: str) -> bool:
+    """
+    True if a namespaced create failed because the namespace does not exist.
+
+    The API server answers with a NotFound Status whose details name the
+    namespace (message 'namespaces "<name>" not found'); any other 404 is
+    left to the caller.
+    """
+    if e.status != 404 or not e.body:
+        return False
+    try:
+        details = orjson.loads(e.body).get("details") or {}
+    except (orjson.JSONDecodeError, AttributeError):
+        return False
+    return details.get("kind") == "namespaces" and details.get("name") == namespace
+
+
+def _orjson_deserialize(api_client: client.ApiClient, response: Any, response_type: Any) -> Any:
+    """ApiClient.deserialize parsing the response body with orjson instead of json."""
+    if response_type == "file":
+        return client.ApiClient.deserialize(api_client, response, response_type)
+    try:
+        data = orjson.loads(response.data)
+    except orjson.JSONDecodeError:
+        data = response.data
+    return api_client._ApiClient__deserialize(data, response_type)
+
+
+class OrjsonRESTClient(rest.RESTClientObject):
+    """
+    Kubernetes REST client encoding JSON request bodies with orjson.
+    
+    Uses the given pool manager (see EKSOperationsService._build_pool_manager)
+    instead of building one. Requests with a dict/list JSON body (job and
+    namespace creation, delete options) are encoded and sent here; all
+    other requests go through the stock implementation.
+    """
+    
+    def __init__(self, pool_manager: urllib3.PoolManager):
+        # RESTClientObject.__init__ only builds the pool manager
+        self.pool_manager = pool_manager
+    
+    def request(self, method, url, query_params=None, headers=None,
+                body=None, post_params=None, _preload_content=True,
+                _request_timeout=None):
+        headers = headers or {}
+        if (
+            not isinstance(body, (dict, list))
+            or method not in ('POST', 'PUT', 'DELETE')
+            or headers.get('Content-Type', 'application/json') != 'application/json'
+        ):
+            return super().request(
+                method, url, query_params=query_params, headers=headers, body=body,
+                post_params=post_params, _preload_content=_preload_content,
+                _request_timeout=_request_timeout
+            )
+        
+        headers['Content-Type'] = 'application/json'
+        if query_params:
+            url += '?' + urlencode(query_params)
+        timeout = None
+        if isinstance(_request_timeout, (int, float)):
+            timeout = urllib3.Timeout(total=_request_timeout)
+        elif isinstance(_request_timeout, tuple) and len(_request_timeout) == 2:
+            timeout = urllib3.Timeout(connect=_request_timeout[0], read=_request_timeout[1])
+        
+        try:
+            r = self.pool_manager.request(
+                method, url,
+                body=orjson.dumps(body),
+                preload_content=_preload_content,
+                timeout=timeout,
+                headers=headers
+            )
+        except urllib3.exceptions.SSLError as e:
+            raise ApiException(status=0, reason=f"{type(e).__name__}\n{e}")
+        
+        if _preload_content:
+            r = rest.RESTResponse(r)
+            r.data = r.data.decode('utf8')
+        if not 200 <= r.status <= 299:
+            raise ApiException(http_resp=r)
+        return r
+
+
+@lru_cache(maxsize=4)
+def _decode_ca_cert(ca_data: str) -> str:
+    """Decode the base64 CA data from describe_cluster to PEM (memoized with the cluster info)."""
+    return base64.b64decode(ca_data).decode('utf-8')
+
+
+def _cluster_info_path(cluster_name: str, region: str) -> Optional[Path]:
+    """Path of the on-disk cluster info cache file, or None if the disk cache is disabled."""
+    if not settings.cluster_info_cache_dir:
+        return None
+    return Path(settings.cluster_info_cache_dir).expanduser() / f"{cluster_name}.{region}.json"
+
+
+def _read_cluster_info_file(path: Path) -> Optional[Tuple[Tuple[str, str], float]]:
+    """
+    Read a cached (endpoint, ca_data) tuple from disk.
+    
+    Returns:
+        Tuple of ((endpoint, ca_data), age in seconds), or None if the file is
+        missing, unreadable, or older than CLUSTER_INFO_DISK_MAX_AGE_SECONDS
+    """
+    try:
+        age = time.time() - path.stat().st_mtime
+        if age >= CLUSTER_INFO_DISK_MAX_AGE_SECONDS:
+            return None
+        data = json.loads(path.read_text())
+        return (data["endpoint"], data["ca_data"]), age
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning("Ignoring unreadable cluster info cache %s: %s", path, e)
+        return None
+
+
+def _write_cluster_info_file(path: Path, endpoint: str, ca_data: str) -> None:
+    """Atomically write (endpoint, ca_data) to the disk cache; failures are only logged."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps({"endpoint": endpoint, "ca_data": ca_data}))
+        os.replace(tmp_path, path)
+    except Exception as e:
+        logger.warning("Could not write cluster info cache %s: %s", path, e)
+
+
+def list_all(list_fn: Callable, page_size: int = 500, **kwargs: Any) -> Tuple[list, str]:
+    """
+    Call a Kubernetes list API page by page and collect all items.
+    
+    Uses limit/_continue pagination so large result sets are fetched in
+    bounded chunks instead of one unbounded response. All pages come from
+    the same consistent snapshot.
+    
+    Args:
+        list_fn: Kubernetes list method (e.g. BatchV1Api.list_job_for_all_namespaces)
+        page_size: Maximum number of items per request
+        **kwargs: Passed to every call (label_selector, field_selector, ...)
+    
+    Returns:
+        Tuple of (items, list resourceVersion)
+    """
+    items = []
+    continue_token = None
+    while True:
+        page = list_fn(limit=page_size, _continue=continue_token, **kwargs)
+        items.extend(page.items)
+        continue_token = page.metadata._continue
+        if not continue_token:
+            return items, page.metadata.resource_version
+
+
+def list_all_raw(list_fn: Callable, page_size: int = 500, **kwargs: Any) -> Tuple[List[Dict[str, Any]], str]:
+    """
+    Like list_all, but returns the items as plain dicts decoded with orjson.
+    
+    For callers that only need a few fields: skips deserializing every item
+    into model classes.
+    """
+    items = []
+    continue_token = None
+    while True:
+        response = list_fn(limit=page_size, _continue=continue_token, _preload_content=False, **kwargs)
+        try:
+            page = orjson.loads(response.data)
+        finally:
+            response.release_conn()
+        items.extend(page.get("items") or ())
+        metadata = page.get("metadata") or {}
+        continue_token = metadata.get("continue")
+        if not continue_token:
+            return items, metadata.get("resourceVersion")
+
+
+# Upper bound of the random head start the background refresher takes on each
+# token refresh, and the pause before retrying a failed background refresh
+TOKEN_REFRESH_JITTER_SECONDS = 30.0
+TOKEN_REFRESH_RETRY_SECONDS = 30.0
+
+# After a failed client initialization, ensure_ready() fails fast with the
+# same error for this long instead of calling STS/EKS again on every request
+INIT_RETRY_BACKOFF_SECONDS = 5.0
+
+# Token caches shared by every service instance in the process, keyed by
+# (cluster name, region), so a rebuilt service reuses the current token
+# instead of presigning a new STS request
+_token_caches: Dict[Tuple[str, str], "TokenCache"] = {}
+_token_caches_lock = threading.Lock()
+
+# ExecCredential field access: response['status']['token']
+_get_status = operator.itemgetter('status')
+_get_token = operator.itemgetter('token')
+
+
+def _seconds_until(timestamp: Optional[str]) -> Optional[float]:
+    """
+    Seconds from now until an RFC 3339 UTC timestamp (e.g. '2026-01-21T10:30:00Z').
+    
+    Returns None if the timestamp is missing or cannot be parsed.
+    """
+    if not timestamp:
+        return None
+    try:
+        expires_at = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+    except ValueError:
+        logger.warning("Unparseable token expirationTimestamp: %s", timestamp)
+        return None
+    if expires_at.tzinfo is None:
+        expires_at = expires_at.replace(tzinfo=timezone.utc)
+    return (expires_at - datetime.now(timezone.utc)).total_seconds()
+
+
+class TokenCache:
+    """
+    Caches the EKS IAM bearer token until shortly before it expires.
+    
+    eks-token presigns an STS request and reports its expiry in the
+    ExecCredential expirationTimestamp (15 minutes out). The token is reused
+    until refresh_ratio of that lifetime has passed, or until fewer than
+    refresh_margin seconds are left, whichever comes first, so every
+    Kubernetes call carries a valid token without generating one per request.
+    """
+    
+    def __init__(
+        self,
+        generate: Callable[[], Tuple[str, Optional[float]]],
+        ttl: float = 15 * 60,
+        refresh_ratio: float = 0.8,
+        refresh_margin: float = 120.0
+    ):
+        """
+        Args:
+            generate: Callable returning (bearer token, seconds until expiry or None)
+            ttl: Lifetime assumed when generate() does not report an expiry
+            refresh_ratio: Fraction of the lifetime after which the token is regenerated
+            refresh_margin: Seconds before expiry at which the token is always regenerated
+        """
+        self._generate = generate
+        self._ttl = ttl
+        self._refresh_ratio = refresh_ratio
+        self._refresh_margin = refresh_margin
+        self._token: Optional[str] = None
+        self._refresh_at = 0.0
+        self._lock = threading.Lock()
+    
+    def _is_fresh(self) -> bool:
+        return self._token is not None and time.monotonic() < self._refresh_at
+    
+    def get(self) -> str:
+        """
+        Return the cached token, regenerating it if it is missing or about to expire.
+        
+        Thread-safe: when the token expires while several worker threads are
+        issuing requests, one thread regenerates it and the others wait for
+        and reuse that token.
+        """
+        if self._is_fresh():
+            return self._token
+        with self._lock:
+            if not self._is_fresh():
+                self._store(*self._generate())
+            return self._token
+    
+    def refresh(self) -> str:
+        """Generate a new token now, even if the cached one is still fresh."""
+        with self._lock:
+            self._store(*self._generate())
+            return self._token
+    
+    def seconds_until_refresh(self) -> float:
+        """Seconds until get() would regenerate the token (0 if it already would)."""
+        if self._token is None:
+            return 0.0
+        return max(self._refresh_at - time.monotonic(), 0.0)
+    
+    def _store(self, token: str, expires_in: Optional[float]) -> None:
+        lifetime = expires_in if expires_in is not None else self._ttl
+        refresh_in = min(lifetime * self._refresh_ratio, lifetime - self._refresh_margin)
+        self._refresh_at = time.monotonic() + max(refresh_in, 0.0)
+        self._token = token
+    
+    def invalidate(self, token: Optional[str] = None) -> None:
+        """
+        Force the next get() to generate a new token.
+        
+        With token given, only invalidates if that token is still the cached
+        one: when several requests fail with the same rejected token, the
+        first one triggers a refresh and the others reuse the new token.
+        """
+        with self._lock:
+            if token is None or token is self._token:
+                self._token = None
 
 
 class EKSOperationsService:
     """
     Service class for managing Kubernetes Jobs and Namespaces in EKS.
     Handles IAM-based authentication and all Kubernetes API operations.
+    
+    One instance serves the whole process and is called from many worker
+    threads at once. k8s_batch_api and k8s_core_api are built on the same
+    ApiClient, so every API group shares one connection pool and one
+    Authorization header; ApiClient and its urllib3 pool are thread-safe.
+    Further API groups must be created from api_client as well.
     """
     
     def __init__(self):
         """
         Initialize the EKS operations service.
-        Sets up AWS and Kubernetes clients with IAM authentication.
+        
+        Only sets attribute defaults; no network I/O happens here. The AWS and
+        Kubernetes clients are set up on first use by ensure_ready().
         """
         self.eks_client = None
+        self._api_client = None
         self.k8s_batch_api = None
         self.k8s_core_api = None
         self._cluster_endpoint = None
         self._ca_cert_data = None
+        self._ssl_context = None
         self._token = None
-        self._configure_clients()
+        self._token_cache = self._shared_token_cache()
+        self._ready = False
+        self._init_lock = threading.Lock()
+        self._init_error: Optional[Exception] = None
+        self._init_failed_at = 0.0
+        self._revalidated_at = 0.0
+        self._token_refresher: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        # Fan-out threads for create_jobs, shared by all batches so that
+        # concurrent batches together stay within the connection pool
+        self._create_executor = ThreadPoolExecutor(
+            max_workers=max(settings.k8s_connection_pool_maxsize, settings.worker_threads),
+            thread_name_prefix="eks-create-jobs"
+        )
+        # Namespaces known to exist (see _ensure_namespace); shared by
+        # worker threads, so guarded by a lock
+        self._known_namespaces = TTLCache(ttl=NAMESPACE_CACHE_TTL_SECONDS)
+        self._known_namespaces_lock = threading.Lock()
+    
+    def _shared_token_cache(self) -> TokenCache:
+        """Return the process-wide TokenCache for the configured cluster, creating it on first use."""
+        key = (settings.eks_cluster_name, settings.eks_region)
+        with _token_caches_lock:
+            token_cache = _token_caches.get(key)
+            if token_cache is None:
+                token_cache = _token_caches[key] = TokenCache(self._generate_token)
+            return token_cache
+    
+    def ensure_ready(self) -> None:
+        """
+        Configure the AWS and Kubernetes clients if that has not happened yet.
+        
+        Called at the top of every Kubernetes operation (and by the startup
+        warm-up and job watcher). After the first successful call this is a
+        single attribute check plus the token freshness check of
+        _ensure_auth(); concurrent first callers wait on a lock for one
+        _configure_clients() run. A failed initialization is retried by the
+        next caller once INIT_RETRY_BACKOFF_SECONDS have passed; until then
+        callers fail fast with a RuntimeError chained to the original error,
+        so a degraded STS/EKS is not called again by every request.
+        """
+        if not self._ready:
+            with self._init_lock:
+                if not self._ready:
+                    self._raise_if_init_backing_off()
+                    try:
+                        self._configure_clients()
+                    except Exception as e:
+                        self._init_error = e
+                        self._init_failed_at = time.monotonic()
+                        raise
+                    self._init_error = None
+                    self._ready = True
+                    self._start_token_refresher()
+        self._ensure_auth()
+    
+    def _raise_if_init_backing_off(self) -> None:
+        """Re-raise the last initialization failure if it happened within INIT_RETRY_BACKOFF_SECONDS."""
+        error = self._init_error
+        if error is None:
+            return
+        elapsed = time.monotonic() - self._init_failed_at
+        if elapsed < INIT_RETRY_BACKOFF_SECONDS:
+            raise RuntimeError(
+                f"EKS client initialization failed {elapsed:.1f}s ago, "
+                f"retrying after {INIT_RETRY_BACKOFF_SECONDS:.0f}s: {error}"
+            ) from error
+    
+    @property
+    def api_client(self) -> client.ApiClient:
+        """
+        The shared Kubernetes ApiClient, configured on first access.
+        
+        Build additional API groups on it (e.g.
+        client.AppsV1Api(service.api_client)) so they reuse the connection
+        pool, authentication and orjson hooks instead of creating their own.
+        Every operation works through it, including PATCH with its patch
+        content types. Build API objects per use (they are thin wrappers):
+        the client is replaced when the service rebuilds it.
+        """
+        self.ensure_ready()
+        return self._api_client
+    
+    def _ensure_auth(self) -> None:
+        """
+        Keep the client's Authorization header on a valid token.
+        
+        The token is sent as an ApiClient default header rather than through
+        Configuration.api_key, so requests skip the api_key/auth_settings
+        lookup; a dict lookup unless the cached token is about to expire, in
+        which case the new token replaces the header (a single dict write).
+        """
+        if settings.use_local_proxy:
+            return
+        token = self._token_cache.get()
+        if token is not self._token:
+            self._token = token
+            self._api_client.set_default_header('Authorization', f'Bearer {token}')
+            logger.info("Refreshed IAM bearer token for Kubernetes API client")
+    
+    def _start_token_refresher(self) -> None:
+        """Start the background token refresh thread (once per service)."""
+        if self._token_refresher is not None or settings.use_local_proxy:
+            return
+        self._token_refresher = threading.Thread(
+            target=self._refresh_token_loop,
+            name="eks-token-refresh",
+            daemon=True
+        )
+        self._token_refresher.start()
+    
+    def _refresh_token_loop(self) -> None:
+        """
+        Regenerate the bearer token shortly before it is due, off the request path.
+        
+        Each refresh happens a random 0-TOKEN_REFRESH_JITTER_SECONDS ahead of
+        the token's refresh point, so replicas started together do not all
+        hit STS at the same moment. The lazy refresh in _ensure_auth() stays
+        as the fallback if this thread falls behind or a refresh fails.
+        """
+        while True:
+            delay = self._token_cache.seconds_until_refresh() - random.uniform(0, TOKEN_REFRESH_JITTER_SECONDS)
+            if self._stop_event.wait(max(delay, 1.0)):
+                return
+            try:
+                self._token_cache.refresh()
+                self._ensure_auth()
+            except Exception as e:
+                logger.warning("Background token refresh failed: %s", e)
+                if self._stop_event.wait(TOKEN_REFRESH_RETRY_SECONDS):
+                    return
+    
+    def _call_api_with_auth_retry(self, call_api: Callable, *args: Any, **kwargs: Any) -> Any:
+        """
+        ApiClient.call_api wrapper: on 401, refresh the token and retry once.
+        
+        A 401 means the API server rejected the token before doing anything
+        (e.g. it expired early or the clock is skewed), so retrying is safe
+        for every method. Concurrent 401s for the same token share a single
+        regeneration (see TokenCache.invalidate).
+        """
+        token = self._token
+        try:
+            return call_api(*args, **kwargs)
+        except ApiException as e:
+            if e.status != 401:
+                raise
+            logger.warning("Kubernetes API rejected the bearer token (401), refreshing it and retrying")
+            self._token_cache.invalidate(token)
+            self._ensure_auth()
+            return call_api(*args, **kwargs)
     
     def _debug_aws_credentials(self) -> Dict[str, Any]:
         """
@@ -65,9 +783,6 @@ class EKSOperationsService:
         Raises:
             Exception: If no credentials can be resolved
         """
-        import os
-        from pathlib import Path
-        
         debug_info = {
             'region': settings.eks_region,
             'env_vars': {},
@@ -106,7 +821,7 @@ class EKSOperationsService:
             
             # Get current AWS identity to verify credentials work
             logger.debug("Attempting to get AWS caller identity to verify credentials...")
-            sts_client = boto3.client('sts', region_name=settings.eks_region)
+            sts_client = _get_aws_client('sts', settings.eks_region)
             identity = sts_client.get_caller_identity()
             
             logger.info("✓ AWS Caller Identity:")
@@ -150,34 +865,17 @@ class EKSOperationsService:
             logger.error("=" * 80)
             raise
     
-    def _get_aws_client(self):
-        """
-        Get boto3 EKS client.
-        
-        AWS credentials are resolved automatically from (first match wins):
-        1. Environment variables: AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY
-        2. Shared credential file: ~/.aws/credentials
-        3. Shared config file: ~/.aws/config
-        4. EC2 instance metadata (IAM role) ← RECOMMENDED
-        5. Container credentials (ECS/EKS)
-        
-        Raises:
-            botocore.exceptions.NoCredentialsError: If no credentials found
-            botocore.exceptions.ClientError: If credentials invalid
-        """
-        logger.debug(f"Creating boto3 EKS client for region: {settings.eks_region}")
-        
-        # Create client without explicit credentials (use credential chain)
-        # This allows boto3 to automatically discover EC2 instance role credentials
-        client = boto3.client('eks', region_name=settings.eks_region)
-        
-        logger.debug("boto3 EKS client created (will use credential chain for auth)")
-        return client
-    
     def _fetch_cluster_info(self) -> Tuple[str, str]:
         """
         Fetch cluster endpoint and CA certificate from EKS.
         
+        Results are cached per process for CLUSTER_INFO_TTL_SECONDS and on disk
+        (settings.cluster_info_cache_dir) for CLUSTER_INFO_DISK_MAX_AGE_SECONDS,
+        so new processes skip describe_cluster; disk entries older than
+        CLUSTER_INFO_DISK_REFRESH_AGE_SECONDS are refreshed in the background
+        (rebuilding the clients if the endpoint or CA changed).
+        Concurrent callers on a cache miss wait for a single describe_cluster call.
+        
         Uses boto3 to call eks.describe_cluster which retrieves:
         - Kubernetes API server endpoint
         - Base64-encoded CA certificate
@@ -199,6 +897,81 @@ class EKSOperationsService:
             botocore.exceptions.ClientError: If cluster not found or auth fails
             Exception: If API call fails for other reason
         """
+        cache_key = (settings.eks_cluster_name, settings.eks_region)
+        with _cluster_info_lock:
+            cached = _cluster_info_cache.get(cache_key)
+            if cached is not None:
+                logger.debug("Using cached cluster info (endpoint=%s)", cached[0])
+                return cached
+            
+            path = _cluster_info_path(*cache_key)
+            on_disk = _read_cluster_info_file(path) if path is not None else None
+            if on_disk is not None:
+                cached, age = on_disk
+                logger.debug("Using cluster info from %s (endpoint=%s, age=%.0fs)", path, cached[0], age)
+                if age >= CLUSTER_INFO_DISK_REFRESH_AGE_SECONDS:
+                    threading.Thread(
+                        target=self._refresh_cluster_info,
+                        args=(cache_key, path),
+                        name="cluster-info-refresh",
+                        daemon=True
+                    ).start()
+                _cluster_info_cache.set(cache_key, cached)
+                return cached
+            
+            endpoint, ca_data = self._describe_cluster()
+            _cluster_info_cache.set(cache_key, (endpoint, ca_data))
+            if path is not None:
+                _write_cluster_info_file(path, endpoint, ca_data)
+            return endpoint, ca_data
+    
+    @classmethod
+    def invalidate_cluster_info(cls) -> None:
+        """
+        Drop the cached endpoint and CA data (in memory and on disk) for the
+        configured cluster, so the next client build calls describe_cluster.
+        """
+        cache_key = (settings.eks_cluster_name, settings.eks_region)
+        with _cluster_info_lock:
+            _cluster_info_cache.invalidate(cache_key)
+            path = _cluster_info_path(*cache_key)
+            if path is not None:
+                path.unlink(missing_ok=True)
+        _decode_ca_cert.cache_clear()
+        logger.info("Cluster info cache invalidated for %s (%s)", *cache_key)
+    
+    def _refresh_cluster_info(self, cache_key: Tuple[str, str], path: Path) -> None:
+        """
+        Background refresh of an aging on-disk cluster info entry.
+        
+        If describe_cluster reports a different endpoint or CA than the one
+        the clients were just built with (cluster recreated or endpoint
+        changed), the clients are rebuilt on next use.
+        """
+        try:
+            endpoint, ca_data = self._describe_cluster()
+        except Exception as e:
+            logger.warning("Background cluster info refresh failed: %s", e)
+            return
+        with _cluster_info_lock:
+            _cluster_info_cache.set(cache_key, (endpoint, ca_data))
+        _write_cluster_info_file(path, endpoint, ca_data)
+        # Compared under the init lock: the refresh starts while
+        # _configure_clients() is still building the clients
+        with self._init_lock:
+            changed = (endpoint, ca_data) != (self._cluster_endpoint, self._ca_cert_data)
+        if changed:
+            self._rebuild_clients("cluster endpoint or CA changed")
+    
+    def _rebuild_clients(self, reason: str) -> None:
+        """Make the next ensure_ready() configure new clients (fresh cluster info, SSL context, pool)."""
+        with self._init_lock:
+            if self._ready:
+                logger.warning("Rebuilding Kubernetes clients: %s", reason)
+                self._ready = False
+    
+    def _describe_cluster(self) -> Tuple[str, str]:
+        """Call eks.describe_cluster and return (endpoint, ca_data), logging troubleshooting hints on failure."""
         try:
             logger.info(f"Fetching cluster info from EKS")
             logger.debug(f"  - Cluster name: {settings.eks_cluster_name}")
@@ -266,7 +1039,7 @@ class EKSOperationsService:
             logger.error("=" * 80)
             raise
     
-    def _generate_token(self) -> str:
+    def _generate_token(self) -> Tuple[str, Optional[float]]:
         """
         Generate short-lived IAM bearer token for Kubernetes authentication.
         
@@ -284,6 +1057,7 @@ class EKSOperationsService:
         
         **This is by design** - it's the Kubernetes exec plugin credential format.
         The actual bearer token is extracted from: response['status']['token']
+        and its expiry from: response['status']['expirationTimestamp']
         
         Uses the eks-token package to create a token from AWS STS.
         This token is valid for 15 minutes.
@@ -294,54 +1068,36 @@ class EKSOperationsService:
         - AWS CLI config (~/.aws/credentials)
         
         Returns:
-            Bearer token string for Kubernetes API authentication
+            Tuple of (bearer token string, seconds until the token expires);
+            the expiry is None if expirationTimestamp is missing or unparseable
         
         Raises:
             ValueError: If token extraction fails or invalid response format
             Exception: If token generation fails
         """
         try:
-            logger.debug(f"Token generation: cluster_name={settings.eks_cluster_name}")
-            logger.info("Generating IAM bearer token via eks-token package")
-            
             # Call eks-token.get_token() - returns ExecCredential dict
             credential_response = get_token(cluster_name=settings.eks_cluster_name)
-            logger.debug(f"eks-token response type: {type(credential_response).__name__}")
-            
-            # Validate response is dict (ExecCredential format)
-            if not isinstance(credential_response, dict):
-                raise ValueError(
-                    f"Expected dict from get_token(), got {type(credential_response).__name__}. "
-                    f"Verify eks-token version: pip show eks-token"
-                )
             
             # Extract token from ExecCredential structure
             # Path: response['status']['token']
             try:
-                token = credential_response.get('status', {}).get('token')
-                if not token:
-                    logger.error(f"ExecCredential response: {credential_response}")
-                    raise ValueError("No token in ExecCredential.status.token")
-            except AttributeError as e:
-                logger.error(
-                    f"Failed to extract token. Response type: {type(credential_response).__name__}, "
-                    f"Keys: {list(credential_response.keys()) if isinstance(credential_response, dict) else 'N/A'}"
-                )
-                raise ValueError(f"Invalid ExecCredential response format: {str(e)}")
-            
-            # Validate token is non-empty string
-            if not isinstance(token, str) or len(token) == 0:
+                status = _get_status(credential_response)
+                token = _get_token(status)
+            except (KeyError, TypeError) as e:
                 raise ValueError(
-                    f"Token is not a non-empty string. Type: {type(token).__name__}, "
-                    f"Length: {len(token) if isinstance(token, str) else 'N/A'}"
-                )
+                    f"Invalid ExecCredential response ({type(credential_response).__name__}), "
+                    f"cannot read status.token: {e!r}. Verify eks-token version: pip show eks-token"
+                ) from e
+            if not isinstance(token, str) or not token:
+                raise ValueError("No token in ExecCredential.status.token")
             
-            logger.debug(f"Token extracted from ExecCredential.status.token")
-            logger.info(f"IAM bearer token generated successfully (length={len(token)} chars, expires ~15 min)")
-            logger.debug(f"Token prefix (first 20 chars): {token[:20]}...")
-            logger.debug(f"Token format check: starts with 'k8s-aws4' = {token.startswith('k8s-aws4')}")
-            
-            return token
+            expires_in = _seconds_until(status.get('expirationTimestamp'))
+            logger.info(
+                "IAM bearer token generated (length=%d chars, expires_in=%s)",
+                len(token), f"{expires_in:.0f}s" if expires_in is not None else "unknown"
+            )
+            return token, expires_in
         
         except ValueError as e:
             logger.error(f"Token extraction failed: {str(e)}")
@@ -357,12 +1113,12 @@ class EKSOperationsService:
         """
         Configure Kubernetes clients with IAM-based authentication.
         
-        **ROOT CAUSE #2**: This method MUST be defined as a class method and called in __init__.
+        **ROOT CAUSE #2**: This method MUST be defined as a class method and called from ensure_ready().
         Error "has no attribute '_configure_clients'" means the method wasn't defined properly.
         
         **INITIALIZATION LIFECYCLE**:
-        1. Called ONCE during __init__ (service instantiation)
-        2. Failure here prevents entire service from working
+        1. Called ONCE, from ensure_ready() on first use (not in __init__)
+        2. Failure here fails the calling operation; the next operation retries
         3. Kubernetes API clients stored as self.k8s_batch_api, self.k8s_core_api
         
         **No kubeconfig files** - IAM-only authentication.
@@ -374,15 +1130,21 @@ class EKSOperationsService:
         4. Generate short-lived IAM bearer token (extracts from ExecCredential dict)
         5. Configure kubernetes.client.Configuration manually
         6. Create Kubernetes API clients (BatchV1Api, CoreV1Api)
+        
+        With settings.use_local_proxy, all of the above is replaced by
+        _configure_proxy_clients().
         """
+        if settings.use_local_proxy:
+            self._configure_proxy_clients()
+            return
         try:
-            logger.info("=" * 80)
-            logger.info("Initializing EKS operations service")
-            logger.info("=" * 80)
-            logger.debug(f"Cluster: {settings.eks_cluster_name}, Region: {settings.eks_region}")
+            logger.info(
+                "Initializing EKS operations service: cluster=%s region=%s",
+                settings.eks_cluster_name, settings.eks_region
+            )
             
             # STEP 0: Debug AWS credentials before attempting API calls
-            logger.info("Step 0/5: Debugging AWS credential resolution")
+            logger.debug("Step 0/5: Debugging AWS credential resolution")
             debug_info = self._debug_aws_credentials()
             logger.debug(f"Credential source: {debug_info.get('credential_source', 'UNKNOWN')}")
             
@@ -391,83 +1153,50 @@ class EKSOperationsService:
                 logger.warning("Kubernetes clients already initialized, reinitializing...")
             
             # STEP 1: Initialize AWS EKS client
-            logger.info("Step 1/5: Creating boto3 EKS client")
-            self.eks_client = self._get_aws_client()
+            logger.debug("Step 1/5: Creating boto3 EKS client")
+            self.eks_client = _get_eks_client(settings.eks_region)
             logger.debug("✓ boto3 EKS client created")
             
-            # STEP 2: Fetch cluster endpoint and CA certificate
-            logger.info("Step 2/5: Fetching cluster endpoint and CA certificate from AWS EKS")
-            self._cluster_endpoint, self._ca_cert_data = self._fetch_cluster_info()
+            # STEPS 2+3: Fetch cluster endpoint/CA certificate and generate the IAM
+            # bearer token concurrently: the two AWS calls are independent, so a
+            # cold start waits for the slower one instead of their sum
+            logger.debug("Step 2/5: Fetching cluster endpoint and CA certificate from AWS EKS")
+            logger.debug("Step 3/5: Generating IAM bearer token via eks-token")
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix="eks-init") as executor:
+                token_future = executor.submit(self._token_cache.get)  # Returns extracted token string
+                self._cluster_endpoint, self._ca_cert_data = self._fetch_cluster_info()
+                self._token = token_future.result()
             logger.debug(f"✓ Cluster endpoint: {self._cluster_endpoint}")
             logger.debug(f"✓ CA certificate data received (base64, {len(self._ca_cert_data)} chars)")
-            
-            # STEP 3: Generate IAM bearer token (handles ExecCredential dict extraction)
-            logger.info("Step 3/5: Generating IAM bearer token via eks-token")
-            self._token = self._generate_token()  # Returns extracted token string
             logger.debug(f"✓ Token extracted from ExecCredential response ({len(self._token)} chars)")
             
-            # STEP 4: Decode CA certificate from base64
-            logger.info("Step 4/5: Decoding CA certificate from base64")
+            # STEP 4: Decode CA certificate and load it into an in-memory SSL context
+            # (no temporary CA file on disk)
+            logger.debug("Step 4/5: Building SSL context from base64 CA certificate")
             try:
-                ca_cert = base64.b64decode(self._ca_cert_data).decode('utf-8')
-                logger.debug(f"✓ CA certificate decoded ({len(ca_cert)} chars)")
+                ca_cert = _decode_ca_cert(self._ca_cert_data)
+                self._ssl_context = ssl.create_default_context(cadata=ca_cert)
+                logger.debug(f"✓ CA certificate decoded and loaded ({len(ca_cert)} chars)")
             except Exception as e:
-                logger.error(f"Failed to decode CA certificate: {str(e)}")
+                logger.error(f"Failed to load CA certificate: {str(e)}")
                 raise ValueError(f"Invalid base64 CA certificate: {str(e)}")
             
-            # STEP 5: Create temporary CA certificate file
-            # Kubernetes client requires this file for SSL verification
-            import tempfile
-            logger.debug("Creating temporary CA certificate file")
-            try:
-                ca_file = tempfile.NamedTemporaryFile(
-                    mode='w',
-                    suffix='.crt',
-                    delete=False,
-                    prefix='eks_ca_'
-                )
-                ca_file.write(ca_cert)
-                ca_file.close()
-                logger.debug(f"✓ CA certificate file: {ca_file.name} ({len(ca_cert)} bytes)")
-            except Exception as e:
-                logger.error(f"Failed to create temp CA file: {str(e)}")
-                raise ValueError(f"Cannot create CA certificate file: {str(e)}")
-            
-            # STEP 6: Configure Kubernetes client with IAM authentication
-            logger.info("Step 5/5: Configuring Kubernetes client with IAM bearer token")
-            try:
-                k8s_config = client.Configuration()
-                k8s_config.host = self._cluster_endpoint
-                k8s_config.ssl_ca_cert = ca_file.name
-                k8s_config.api_key['authorization'] = f'Bearer {self._token}'
-                k8s_config.api_key_prefix['authorization'] = ''
-                logger.debug(f"✓ Host: {self._cluster_endpoint}")
-                logger.debug(f"✓ SSL CA cert: {ca_file.name}")
-                logger.debug(f"✓ Auth header: Bearer <{len(self._token)}-char token>")
-            except Exception as e:
-                logger.error(f"Failed to configure Kubernetes client: {str(e)}")
-                raise ValueError(f"Kubernetes config error: {str(e)}")
+            # STEP 5: Configure Kubernetes client with IAM authentication
+            logger.debug("Step 5/5: Configuring Kubernetes client with IAM bearer token")
+            k8s_config = self._k8s_configuration(self._cluster_endpoint)
+            logger.debug("✓ SSL CA cert: in-memory cluster CA")
             
-            # STEP 7: Create Kubernetes API clients
-            logger.info("Step 6/6: Creating Kubernetes API client instances")
-            try:
-                api_client = client.ApiClient(k8s_config)
-                self.k8s_batch_api = client.BatchV1Api(api_client)
-                self.k8s_core_api = client.CoreV1Api(api_client)
-                logger.debug("✓ BatchV1Api created (Job operations)")
-                logger.debug("✓ CoreV1Api created (Namespace operations)")
-            except Exception as e:
-                logger.error(f"Failed to create API clients: {str(e)}")
-                raise ValueError(f"API client creation error: {str(e)}")
+            # STEP 6: Create Kubernetes API clients
+            logger.debug("Step 6/6: Creating Kubernetes API client instances")
+            self._create_api_clients(k8s_config)
+            # Bearer token as a default header (see _ensure_auth); a 401
+            # refreshes it and retries the call once
+            self._api_client.set_default_header('Authorization', f'Bearer {self._token}')
+            self._api_client.call_api = partial(self._call_api_with_auth_retry, self._api_client.call_api)
+            logger.debug(f"✓ Auth header: Bearer <{len(self._token)}-char token>")
             
             # SUCCESS
-            logger.info("=" * 80)
-            logger.info("✓ EKS operations service initialized successfully")
-            logger.info(f"✓ Cluster: {settings.eks_cluster_name}")
-            logger.info(f"✓ Region: {settings.eks_region}")
-            logger.info(f"✓ Endpoint: {self._cluster_endpoint}")
-            logger.info("✓ Ready for Kubernetes operations")
-            logger.info("=" * 80)
+            logger.info("✓ EKS operations service initialized: endpoint=%s", self._cluster_endpoint)
         
         except Exception as e:
             logger.error("=" * 80)
@@ -485,6 +1214,198 @@ class EKSOperationsService:
             logger.error("=" * 80)
             raise
     
+    def _k8s_configuration(self, host: str) -> client.Configuration:
+        """Build the Kubernetes client configuration (host, pool size, retries)."""
+        try:
+            k8s_config = client.Configuration()
+            k8s_config.host = host
+            # One keep-alive pool shared by all worker threads; TCP+TLS
+            # connections are reused instead of re-handshaking per call.
+            # Never smaller than the worker pool, so every thread that can
+            # be in a Kubernetes call keeps a warm connection.
+            k8s_config.connection_pool_maxsize = max(
+                settings.k8s_connection_pool_maxsize,
+                settings.worker_threads
+            )
+            # Absorb transient API server / load balancer errors inside the
+            # pool. Status retries only apply to idempotent methods, so a
+            # create is never sent twice; connection errors are retried
+            # for every method since the request never reached the server.
+            k8s_config.retries = urllib3.Retry(
+                total=2,
+                backoff_factor=0.1,
+                status_forcelist=(429, 502, 503, 504),
+                raise_on_status=False
+            )
+            logger.debug(f"✓ Host: {host}")
+            logger.debug(f"✓ Connection pool maxsize: {k8s_config.connection_pool_maxsize}")
+            logger.debug(f"✓ Retries: {k8s_config.retries}")
+            return k8s_config
+        except Exception as e:
+            logger.error(f"Failed to configure Kubernetes client: {str(e)}")
+            raise ValueError(f"Kubernetes config error: {str(e)}")
+    
+    def _create_api_clients(self, k8s_config: client.Configuration) -> None:
+        """Create the shared ApiClient (with its request-path shortcuts) and the Batch/Core APIs."""
+        try:
+            previous = self._api_client
+            self._api_client = client.ApiClient(k8s_config)
+            self._api_client.rest_client.pool_manager.clear()
+            self._api_client.rest_client = OrjsonRESTClient(self._build_pool_manager(k8s_config))
+            # Per-request shortcuts: JSON header negotiation short-circuits
+            # (other media types, e.g. PATCH, use the stock selection), and
+            # plain-dict bodies skip the recursive sanitize pass
+            self._api_client.select_header_accept = partial(
+                _select_json, self._api_client.select_header_accept
+            )
+            self._api_client.select_header_content_type = partial(
+                _select_json, self._api_client.select_header_content_type
+            )
+            self._api_client.sanitize_for_serialization = partial(
+                _fast_sanitize, self._api_client.sanitize_for_serialization
+            )
+            # JSON bodies are encoded (OrjsonRESTClient) and responses
+            # parsed with orjson instead of the stdlib json module
+            self._api_client.deserialize = partial(_orjson_deserialize, self._api_client)
+            self.k8s_batch_api = client.BatchV1Api(self._api_client)
+            self.k8s_core_api = client.CoreV1Api(self._api_client)
+            logger.debug("✓ BatchV1Api created (Job operations)")
+            logger.debug("✓ CoreV1Api created (Namespace operations)")
+            if previous is not None:
+                # Rebuild: close the old pool's idle connections (calls still
+                # in flight finish on their connection)
+                previous.rest_client.pool_manager.clear()
+        except Exception as e:
+            logger.error(f"Failed to create API clients: {str(e)}")
+            raise ValueError(f"API client creation error: {str(e)}")
+    
+    def _configure_proxy_clients(self) -> None:
+        """
+        Configure the Kubernetes clients against a local kubectl proxy.
+        
+        The proxy (e.g. a `kubectl proxy` sidecar on settings.local_proxy_url)
+        authenticates to the cluster itself and is reached over plain HTTP
+        on localhost, so describe_cluster, token generation and the cluster
+        CA are all skipped.
+        """
+        logger.info("Initializing EKS operations service via local proxy: %s", settings.local_proxy_url)
+        self._cluster_endpoint = settings.local_proxy_url
+        self._create_api_clients(self._k8s_configuration(settings.local_proxy_url))
+        logger.info("✓ EKS operations service initialized: endpoint=%s (proxy)", self._cluster_endpoint)
+    
+    def _build_pool_manager(self, k8s_config: client.Configuration) -> urllib3.PoolManager:
+        """
+        Build the connection pool for the Kubernetes API client.
+        
+        Same settings RESTClientObject derives from the configuration, but
+        verifies the API server against the in-memory cluster CA
+        (self._ssl_context) instead of a CA file path.
+        """
+        return urllib3.PoolManager(
+            num_pools=4,
+            maxsize=k8s_config.connection_pool_maxsize,
+            cert_reqs=ssl.CERT_REQUIRED,
+            ssl_context=self._ssl_context,
+            retries=k8s_config.retries
+        )
+    
+    def check_connectivity(self, timeout_seconds: float = 5.0) -> None:
+        """
+        Verify the Kubernetes API server is reachable and accepts our token.
+        
+        Calls the lightweight /version endpoint. Used by the readiness probe.
+        
+        If the API server cannot be reached or its certificate does not
+        verify, the cached endpoint and CA may be stale (cluster recreated,
+        endpoint changed), so the cluster info is invalidated and the clients
+        are rebuilt on next use, at most once per
+        CLUSTER_INFO_REVALIDATE_SECONDS.
+        
+        Raises:
+            Exception: If the API server cannot be reached or rejects the request
+        """
+        try:
+            client.VersionApi(self.api_client).get_code(_request_timeout=timeout_seconds)
+        except Exception as e:
+            if _is_endpoint_error(e) and not settings.use_local_proxy:
+                self._revalidate_cluster_info(e)
+            raise
+    
+    def _revalidate_cluster_info(self, error: BaseException) -> None:
+        """Drop the cached cluster info and rebuild the clients after an endpoint error (rate limited)."""
+        now = time.monotonic()
+        if now - self._revalidated_at < CLUSTER_INFO_REVALIDATE_SECONDS:
+            return
+        self._revalidated_at = now
+        logger.warning("Kubernetes API server unreachable or untrusted (%s), refreshing cluster info", error)
+        self.invalidate_cluster_info()
+        self._rebuild_clients("cluster info invalidated")
+    
+    def close(self) -> None:
+        """
+        Release the shared Kubernetes API client and its connection pool.
+        
+        Called once from the application lifespan on shutdown. The service
+        must not be used after this method returns.
+        """
+        self._stop_event.set()
+        self._create_executor.shutdown(wait=False, cancel_futures=True)
+        if self._api_client is None:
+            return
+        
+        logger.info("Closing Kubernetes API client and connection pool")
+        try:
+            self._api_client.close()
+            self._api_client.rest_client.pool_manager.clear()
+        except Exception as e:
+            logger.warning(f"Error while closing Kubernetes API client: {str(e)}")
+        finally:
+            self._api_client = None
+            self.k8s_batch_api = None
+            self.k8s_core_api = None
+    
+    def _ensure_namespace(self, namespace: str) -> None:
+        """
+        Create the namespace if it does not exist yet.
+        
+        Namespaces seen within NAMESPACE_CACHE_TTL_SECONDS are assumed to
+        still exist and skip the read_namespace round-trip.
+        """
+        with self._known_namespaces_lock:
+            if self._known_namespaces.get(namespace):
+                return
+        
+        try:
+            self.k8s_core_api.read_namespace(namespace)
+            if DEBUG_ENABLED:
+                logger.debug("Namespace %s found", namespace)
+        except ApiException as e:
+            if e.status != 404:
+                raise
+            logger.warning("Namespace %s not found. Creating it.", namespace)
+            self._auto_create_namespace(namespace)
+        self._mark_namespace_known(namespace)
+    
+    def _auto_create_namespace(self, namespace: str) -> None:
+        """Create a namespace needed by a job; an AlreadyExists conflict (concurrent creation) counts as success."""
+        with log_operation(logger, "create_namespace", namespace=namespace, auto_created=True):
+            try:
+                self.k8s_core_api.create_namespace(
+                    body=_NAMESPACE_TEMPLATE | {"metadata": {"name": namespace}}
+                )
+            except ApiException as e:
+                if e.status != 409:
+                    raise
+        self._mark_namespace_known(namespace)
+    
+    def _mark_namespace_known(self, namespace: str) -> None:
+        with self._known_namespaces_lock:
+            self._known_namespaces.set(namespace, True)
+    
+    def _forget_namespace(self, namespace: str) -> None:
+        with self._known_namespaces_lock:
+            self._known_namespaces.invalidate(namespace)
+    
     def create_job(
         self,
         job_name: str,
@@ -494,6 +1415,11 @@ class EKSOperationsService:
         """
         Create a Kubernetes Job in the EKS cluster.
         
+        The job is created optimistically, without checking the namespace
+        first: one round-trip in the common case. If the API server reports
+        the namespace as missing, it is created and the job creation retried
+        once.
+        
         Args:
             job_name: Name of the job
             job_manifest: Kubernetes Job manifest (dict)
@@ -506,74 +1432,106 @@ class EKSOperationsService:
             ApiException: If Kubernetes API call fails
         
         Implementation Steps:
-        1. Check if namespace exists, create if needed
-        2. Build job manifest with labels and metadata
-        3. Send create_namespaced_job request to Kubernetes API
-        4. Return job metadata in structured response
+        1. Build job manifest with labels and metadata
+        2. Send create_namespaced_job request to Kubernetes API
+           (on "namespace not found": create the namespace, retry once)
+        3. Return job metadata in structured response
         """
-        from app.utils.logger import log_operation
-        
+        self.ensure_ready()
         try:
-            logger.debug(f"Creating job {job_name} in namespace {namespace}")
+            if DEBUG_ENABLED:
+                logger.debug("Creating job %s in namespace %s", job_name, namespace)
             
             with log_operation(logger, "create_job", job=job_name, namespace=namespace):
-                # Step 1: Ensure namespace exists
-                logger.debug(f"Step 1: Verifying namespace {namespace} exists")
-                try:
-                    self.k8s_core_api.read_namespace(namespace)
-                    logger.debug(f"Namespace {namespace} found")
-                except ApiException as e:
-                    if e.status == 404:
-                        logger.warning(f"Namespace {namespace} not found. Creating it.")
-                        with log_operation(logger, "create_namespace", namespace=namespace, auto_created=True):
-                            self.create_namespace(namespace)
-                    else:
-                        raise
-                
-                # Step 2: Build job manifest
-                logger.debug(f"Step 2: Building job manifest for {job_name}")
-                job_body = {
-                    "apiVersion": "batch/v1",
-                    "kind": "Job",
+                # Step 1: Build job manifest
+                if DEBUG_ENABLED:
+                    logger.debug("Step 1: Building job manifest for %s", job_name)
+                job_body = _JOB_TEMPLATE | {
                     "metadata": {
                         "name": job_name,
                         "namespace": namespace,
-                        "labels": {
-                            "app": "eks-api",
-                            "job-id": job_name
-                        }
+                        "labels": _JOB_LABELS | {"job-id": job_name}
                     },
                     "spec": job_manifest.get("spec", {})
                 }
-                logger.debug(f"Job manifest built with spec keys: {list(job_body['spec'].keys())}")
                 
-                # Step 3: Create the job
-                logger.debug(f"Step 3: Sending create_namespaced_job request to Kubernetes API")
-                response = self.k8s_batch_api.create_namespaced_job(
-                    namespace=namespace,
-                    body=job_body
-                )
-                logger.debug(f"Kubernetes API returned response with metadata: {response.metadata.name}")
+                # Step 2: Create the job
+                if DEBUG_ENABLED:
+                    logger.debug("Step 2: Sending create_namespaced_job request to Kubernetes API")
+                try:
+                    response = self.k8s_batch_api.create_namespaced_job(
+                        namespace=namespace,
+                        body=job_body
+                    )
+                except ApiException as e:
+                    if not _is_namespace_missing(e, namespace):
+                        raise
+                    logger.warning("Namespace %s not found while creating job %s. Creating it.", namespace, job_name)
+                    self._forget_namespace(namespace)
+                    self._auto_create_namespace(namespace)
+                    response = self.k8s_batch_api.create_namespaced_job(
+                        namespace=namespace,
+                        body=job_body
+                    )
+                self._mark_namespace_known(namespace)
+                if DEBUG_ENABLED:
+                    logger.debug("Kubernetes API returned response with metadata: %s", response.metadata.name)
                 
-                # Step 4: Format and return response
-                logger.debug(f"Step 4: Formatting response")
+                # Step 3: Format and return response
+                if DEBUG_ENABLED:
+                    logger.debug("Step 3: Formatting response")
                 result = {
                     "job_name": response.metadata.name,
                     "namespace": response.metadata.namespace,
-                    "creation_timestamp": response.metadata.creation_timestamp.isoformat() if response.metadata.creation_timestamp else None,
+                    "creation_timestamp": response.metadata.creation_timestamp,
                     "status": "created"
                 }
-                logger.debug(f"Job creation response ready: {result}")
+                if DEBUG_ENABLED:
+                    logger.debug("Job creation response ready: %s", result)
                 
                 return result
         
         except ApiException as e:
-            logger.error(f"Kubernetes API error creating job: {str(e)}", exc_info=True)
+            logger.error("Kubernetes API error creating job: %s", e, exc_info=True)
             raise
         except Exception as e:
-            logger.error(f"Unexpected error creating job: {str(e)}", exc_info=True)
+            logger.error("Unexpected error creating job: %s", e, exc_info=True)
             raise
     
+    def create_jobs(
+        self,
+        specs: List[Tuple[str, Dict[str, Any], str]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Create several Kubernetes Jobs concurrently.
+        
+        Each distinct namespace is checked (and created if needed) once up
+        front, so parallel creations do not all race to create a missing
+        namespace. The create_namespaced_job calls are then issued in
+        parallel from a thread pool shared by all batches and no larger than
+        the Kubernetes connection pool, so N jobs cost roughly one
+        round-trip instead of N, and concurrent batches queue for threads
+        instead of opening connections beyond the pool.
+        
+        Args:
+            specs: List of (job_name, job_manifest, namespace) tuples
+        
+        Returns:
+            List of create_job results, in the same order as specs
+        
+        Raises:
+            ApiException: If a namespace check or any job creation fails;
+                jobs submitted before the failure are not rolled back
+        """
+        if not specs:
+            return []
+        
+        self.ensure_ready()
+        for namespace in dict.fromkeys(namespace for _, _, namespace in specs):
+            self._ensure_namespace(namespace)
+        
+        return list(self._create_executor.map(lambda spec: self.create_job(*spec), specs))
+    
     def delete_job(
         self,
         job_name: str,
@@ -597,21 +1555,24 @@ class EKSOperationsService:
         2. Use Foreground propagation policy for graceful deletion
         3. Return success confirmation
         """
-        from app.utils.logger import log_operation
-        
+        self.ensure_ready()
         try:
-            logger.debug(f"Deleting job {job_name} from namespace {namespace}")
+            if DEBUG_ENABLED:
+                logger.debug("Deleting job %s from namespace %s", job_name, namespace)
             
             with log_operation(logger, "delete_job", job=job_name, namespace=namespace):
-                logger.debug(f"Step 1: Sending delete_namespaced_job request to Kubernetes API")
+                if DEBUG_ENABLED:
+                    logger.debug("Step 1: Sending delete_namespaced_job request to Kubernetes API")
                 self.k8s_batch_api.delete_namespaced_job(
                     name=job_name,
                     namespace=namespace,
-                    body=client.V1DeleteOptions(propagation_policy='Foreground')
+                    body=_DELETE_FOREGROUND
                 )
-                logger.debug(f"Kubernetes API confirmed job deletion")
+                if DEBUG_ENABLED:
+                    logger.debug("Kubernetes API confirmed job deletion")
             
-            logger.debug(f"Job {job_name} deletion request accepted")
+            if DEBUG_ENABLED:
+                logger.debug("Job %s deletion request accepted", job_name)
             
             return {
                 "message": f"Job {job_name} deleted successfully",
@@ -620,15 +1581,15 @@ class EKSOperationsService:
         
         except ApiException as e:
             if e.status == 404:
-                logger.warning(f"Job {job_name} not found in namespace {namespace}")
+                logger.warning("Job %s not found in namespace %s", job_name, namespace)
                 raise ApiException(
                     status=404,
                     reason=f"Job {job_name} not found in namespace {namespace}"
                 )
-            logger.error(f"Kubernetes API error deleting job: {str(e)}", exc_info=True)
+            logger.error("Kubernetes API error deleting job: %s", e, exc_info=True)
             raise
         except Exception as e:
-            logger.error(f"Unexpected error deleting job: {str(e)}", exc_info=True)
+            logger.error("Unexpected error deleting job: %s", e, exc_info=True)
             raise
     
     def get_job_status(
@@ -652,68 +1613,186 @@ class EKSOperationsService:
         Implementation Steps:
         1. Send read_namespaced_job request to Kubernetes API
         2. Analyze job status to determine state (running/completed/failed/unknown)
-        3. Extract and format status fields
+        3. Extract and format status fields (see format_raw_job_status)
         4. Return structured status response
         """
-        from app.utils.logger import log_operation
-        
+        self.ensure_ready()
         try:
-            logger.debug(f"Fetching status for job {job_name} in namespace {namespace}")
+            if DEBUG_ENABLED:
+                logger.debug("Fetching status for job %s in namespace %s", job_name, namespace)
             
             with log_operation(logger, "get_job_status", job=job_name, namespace=namespace):
-                logger.debug(f"Step 1: Sending read_namespaced_job request to Kubernetes API")
-                job = self.k8s_batch_api.read_namespaced_job(
+                if DEBUG_ENABLED:
+                    logger.debug("Step 1: Sending read_namespaced_job request to Kubernetes API")
+                # Raw response: only a few status fields are needed, so the
+                # body is decoded with orjson instead of into a V1Job
+                response = self.k8s_batch_api.read_namespaced_job(
                     name=job_name,
-                    namespace=namespace
+                    namespace=namespace,
+                    _preload_content=False
                 )
-                logger.debug(f"Kubernetes API returned job object with status field")
-                
-                status = job.status
-                
-                # Step 2: Determine job state
-                logger.debug(f"Step 2: Analyzing job status to determine state")
-                if status.succeeded and status.succeeded > 0:
-                    job_state = "completed"
-                    logger.debug(f"Job state determined: completed (succeeded={status.succeeded})")
-                elif status.failed and status.failed > 0:
-                    job_state = "failed"
-                    logger.debug(f"Job state determined: failed (failed={status.failed})")
-                elif status.active and status.active > 0:
-                    job_state = "running"
-                    logger.debug(f"Job state determined: running (active={status.active})")
-                else:
-                    job_state = "unknown"
-                    logger.debug(f"Job state determined: unknown (active={status.active}, succeeded={status.succeeded}, failed={status.failed})")
+                try:
+                    job = orjson.loads(response.data)
+                finally:
+                    response.release_conn()
+                if DEBUG_ENABLED:
+                    logger.debug("Kubernetes API returned job object with status field")
                 
-                # Step 3: Extract status fields
-                logger.debug(f"Step 3: Extracting status fields")
-                result = {
-                    "job_name": job.metadata.name,
-                    "namespace": job.metadata.namespace,
-                    "state": job_state,
-                    "active": status.active or 0,
-                    "succeeded": status.succeeded or 0,
-                    "failed": status.failed or 0,
-                    "start_time": status.start_time.isoformat() if status.start_time else None,
-                    "completion_time": status.completion_time.isoformat() if status.completion_time else None
-                }
-                logger.debug(f"Status response formatted: state={job_state}, active={result['active']}, succeeded={result['succeeded']}, failed={result['failed']}")
+                # Step 2/3: Determine job state and extract status fields
+                if DEBUG_ENABLED:
+                    logger.debug("Step 2: Analyzing job status to determine state")
+                result = format_raw_job_status(job)
+                if DEBUG_ENABLED:
+                    logger.debug(
+                        "Status response formatted: state=%s, active=%s, succeeded=%s, failed=%s",
+                        result['state'], result['active'], result['succeeded'], result['failed']
+                    )
                 
                 return result
         
         except ApiException as e:
             if e.status == 404:
-                logger.warning(f"Job {job_name} not found in namespace {namespace}")
+                logger.warning("Job %s not found in namespace %s", job_name, namespace)
                 raise ApiException(
                     status=404,
                     reason=f"Job {job_name} not found in namespace {namespace}"
                 )
-            logger.error(f"Kubernetes API error fetching job status: {str(e)}", exc_info=True)
+            logger.error("Kubernetes API error fetching job status: %s", e, exc_info=True)
             raise
         except Exception as e:
-            logger.error(f"Unexpected error fetching job status: {str(e)}", exc_info=True)
+            logger.error("Unexpected error fetching job status: %s", e, exc_info=True)
             raise
     
+    def get_jobs_status(
+        self,
+        job_names: List[str],
+        namespace: str = "default"
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Get the status of several Kubernetes Jobs with one list request.
+        
+        Field selectors cannot OR several metadata.name values, but create_job
+        labels every job with job-id=<job name>, so a set-based label selector
+        (app=eks-api,job-id in (a,b,...)) lets the API server return exactly
+        the requested jobs: one round-trip per JOB_ID_SELECTOR_CHUNK names
+        instead of one GET per job. Responses are decoded with orjson, not
+        into V1Job objects. Jobs not created through this API do not carry
+        the labels and are reported as missing.
+        
+        Args:
+            job_names: Names of the jobs
+            namespace: Kubernetes namespace (default: "default")
+        
+        Returns:
+            Dict mapping each requested name to its status dict (see
+            format_raw_job_status), or None if no such job was found
+        
+        Raises:
+            ApiException: If the list request fails
+        """
+        self.ensure_ready()
+        # Names that are not valid label values cannot belong to a job created
+        # here (its job-id label would have been rejected); leaving them out
+        # keeps one bad name from failing the whole selector
+        wanted = sorted({name for name in job_names if _LABEL_VALUE_RE.fullmatch(name)})
+        found = {}
+        with log_operation(logger, "get_jobs_status", namespace=namespace, count=len(job_names)):
+            for i in range(0, len(wanted), JOB_ID_SELECTOR_CHUNK):
+                chunk = wanted[i:i + JOB_ID_SELECTOR_CHUNK]
+                jobs, _ = list_all_raw(
+                    self.k8s_batch_api.list_namespaced_job,
+                    namespace=namespace,
+                    label_selector=f"app=eks-api,job-id in ({','.join(chunk)})"
+                )
+                for job in jobs:
+                    status = format_raw_job_status(job)
+                    found[status["job_name"]] = status
+        return {name: found.get(name) for name in job_names}
+    
+    def watch_job(
+        self,
+        job_name: str,
+        namespace: str = "default",
+        timeout_seconds: float = 300.0
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream status updates for a single Job until it finishes.
+        
+        Opens a watch on the job (field_selector metadata.name=job_name) over
+        the shared API client, so the API server pushes each change instead
+        of the caller polling get_job_status. Replaces loops like
+        
+            while True:
+                status = service.get_job_status(job_name, namespace)
+                time.sleep(1)
+        
+        with
+        
+            for status in service.watch_job(job_name, namespace):
+                ...
+        
+        The first update reflects the current state; unchanged statuses (e.g.
+        after a reconnect) are not repeated. The stream ends after a
+        terminal state (completed / failed), when the job is deleted, or
+        after timeout_seconds. Server-side watch timeouts and expired
+        resourceVersions (410) reconnect transparently; a 401 (token expired
+        mid-stream) invalidates the cached token and reconnects once with a
+        new one.
+        
+        Args:
+            job_name: Name of the job
+            namespace: Kubernetes namespace (default: "default")
+            timeout_seconds: Maximum total time to watch
+        
+        Yields:
+            Status dicts in the format of get_job_status (see format_job_status)
+        
+        Raises:
+            ApiException: If the watch fails for another reason
+        """
+        self.ensure_ready()
+        deadline = time.monotonic() + timeout_seconds
+        resource_version = None
+        retried_auth = False
+        last_status = None
+        
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            self._ensure_auth()
+            job_watch = watch.Watch()
+            try:
+                for event in job_watch.stream(
+                    self.k8s_batch_api.list_namespaced_job,
+                    namespace=namespace,
+                    field_selector=f"metadata.name={job_name}",
+                    resource_version=resource_version,
+                    timeout_seconds=max(1, int(remaining))
+                ):
+                    if event["type"] == "DELETED":
+                        return
+                    retried_auth = False
+                    status = format_job_status(event["object"])
+                    if status == last_status:
+                        continue
+                    last_status = status
+                    yield status
+                    if status["state"] in TERMINAL_JOB_STATES:
+                        return
+                resource_version = job_watch.resource_version or resource_version
+            except ApiException as e:
+                if e.status == 410:
+                    resource_version = None
+                elif e.status == 401 and not retried_auth:
+                    logger.info("Watch for job %s rejected with 401, refreshing token", job_name)
+                    self._token_cache.invalidate(self._token)
+                    retried_auth = True
+                else:
+                    raise
+            finally:
+                job_watch.stop()
+    
     def create_namespace(self, namespace_name: str) -> Dict[str, Any]:
         """
         Create a Kubernetes Namespace in the EKS cluster.
@@ -732,43 +1811,43 @@ class EKSOperationsService:
         2. Send create_namespace request to Kubernetes API
         3. Return namespace metadata in structured response
         """
-        from app.utils.logger import log_operation
-        
+        self.ensure_ready()
         try:
-            logger.debug(f"Creating namespace {namespace_name}")
+            if DEBUG_ENABLED:
+                logger.debug("Creating namespace %s", namespace_name)
             
             with log_operation(logger, "create_namespace", namespace=namespace_name):
-                logger.debug(f"Step 1: Building namespace manifest for {namespace_name}")
-                namespace_body = {
-                    "apiVersion": "v1",
-                    "kind": "Namespace",
-                    "metadata": {
-                        "name": namespace_name
-                    }
-                }
-                logger.debug(f"Namespace manifest created with name={namespace_name}")
+                if DEBUG_ENABLED:
+                    logger.debug("Step 1: Building namespace manifest for %s", namespace_name)
+                namespace_body = _NAMESPACE_TEMPLATE | {"metadata": {"name": namespace_name}}
+                if DEBUG_ENABLED:
+                    logger.debug("Namespace manifest created with name=%s", namespace_name)
                 
-                logger.debug(f"Step 2: Sending create_namespace request to Kubernetes API")
+                if DEBUG_ENABLED:
+                    logger.debug("Step 2: Sending create_namespace request to Kubernetes API")
                 response = self.k8s_core_api.create_namespace(
                     body=namespace_body
                 )
-                logger.debug(f"Kubernetes API returned response with metadata: {response.metadata.name}")
+                if DEBUG_ENABLED:
+                    logger.debug("Kubernetes API returned response with metadata: %s", response.metadata.name)
                 
-                logger.debug(f"Step 3: Formatting response")
+                if DEBUG_ENABLED:
+                    logger.debug("Step 3: Formatting response")
                 result = {
                     "namespace_name": response.metadata.name,
-                    "creation_timestamp": response.metadata.creation_timestamp.isoformat() if response.metadata.creation_timestamp else None,
+                    "creation_timestamp": response.metadata.creation_timestamp,
                     "status": "created"
                 }
-                logger.debug(f"Namespace creation response ready: {result}")
+                if DEBUG_ENABLED:
+                    logger.debug("Namespace creation response ready: %s", result)
                 
                 return result
         
         except ApiException as e:
-            logger.error(f"Kubernetes API error creating namespace: {str(e)}", exc_info=True)
+            logger.error("Kubernetes API error creating namespace: %s", e, exc_info=True)
             raise
         except Exception as e:
-            logger.error(f"Unexpected error creating namespace: {str(e)}", exc_info=True)
+            logger.error("Unexpected error creating namespace: %s", e, exc_info=True)
             raise
     
     def delete_namespace(self, namespace_name: str) -> Dict[str, str]:
@@ -789,20 +1868,25 @@ class EKSOperationsService:
         2. Use Foreground propagation policy for graceful deletion
         3. Return success confirmation
         """
-        from app.utils.logger import log_operation
-        
+        self.ensure_ready()
         try:
-            logger.debug(f"Deleting namespace {namespace_name}")
+            if DEBUG_ENABLED:
+                logger.debug("Deleting namespace %s", namespace_name)
+            # Jobs submitted from now on must not skip the existence check
+            self._forget_namespace(namespace_name)
             
             with log_operation(logger, "delete_namespace", namespace=namespace_name):
-                logger.debug(f"Step 1: Sending delete_namespace request to Kubernetes API")
+                if DEBUG_ENABLED:
+                    logger.debug("Step 1: Sending delete_namespace request to Kubernetes API")
                 self.k8s_core_api.delete_namespace(
                     name=namespace_name,
-                    body=client.V1DeleteOptions(propagation_policy='Foreground')
+                    body=_DELETE_FOREGROUND
                 )
-                logger.debug(f"Kubernetes API confirmed namespace deletion")
+                if DEBUG_ENABLED:
+                    logger.debug("Kubernetes API confirmed namespace deletion")
             
-            logger.debug(f"Namespace {namespace_name} deletion request accepted")
+            if DEBUG_ENABLED:
+                logger.debug("Namespace %s deletion request accepted", namespace_name)
             
             return {
                 "message": f"Namespace {namespace_name} deleted successfully",
@@ -811,31 +1895,51 @@ class EKSOperationsService:
         
         except ApiException as e:
             if e.status == 404:
-                logger.warning(f"Namespace {namespace_name} not found")
+                logger.warning("Namespace %s not found", namespace_name)
                 raise ApiException(
                     status=404,
                     reason=f"Namespace {namespace_name} not found"
                 )
-            logger.error(f"Kubernetes API error deleting namespace: {str(e)}", exc_info=True)
+            logger.error("Kubernetes API error deleting namespace: %s", e, exc_info=True)
             raise
         except Exception as e:
-            logger.error(f"Unexpected error deleting namespace: {str(e)}", exc_info=True)
+            logger.error("Unexpected error deleting namespace: %s", e, exc_info=True)
             raise
 
 
-# Global service instance
-_service_instance: Optional[EKSOperationsService] = None
+# Process-wide service instance (see get_eks_service)
+_service: Optional[EKSOperationsService] = None
+_service_lock = threading.Lock()
 
 
 def get_eks_service() -> EKSOperationsService:
     """
     Get or create the EKS operations service instance.
-    Uses lazy initialization on first call.
+    
+    Called from the application lifespan on startup; route handlers
+    receive the resulting instance from app.state via dependency injection.
+    Construction is cheap: clients are configured lazily (see
+    EKSOperationsService.ensure_ready). The instance is created once per
+    process with double-checked locking, so concurrent first callers share
+    one instance (one ApiClient, connection pool and token). After the
+    instance has been closed, call reset_eks_service() so a new one is
+    built on next use.
     
     Returns:
         EKSOperationsService instance
     """
-    global _service_instance
-    if _service_instance is None:
-        _service_instance = EKSOperationsService()
-    return _service_instance
+    global _service
+    service = _service
+    if service is None:
+        with _service_lock:
+            if _service is None:
+                _service = EKSOperationsService()
+            service = _service
+    return service
+
+
+def reset_eks_service() -> None:
+    """Forget the process-wide service instance (after closing it)."""
+    global _service
+    with _service_lock:
+        _service = None
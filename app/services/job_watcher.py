@@ -0,0 +1,397 @@
+"""
+Watch-backed in-memory cache of Kubernetes Job status.
+
+Instead of answering every status poll with a GET to the API server, a single
+long-lived watch stream over all Jobs created by this API (label app=eks-api)
+keeps an in-memory map of (namespace, job_name) -> status dict up to date.
+
+Watch Lifecycle:
+1. LIST jobs to seed the cache and obtain a resourceVersion
+2. WATCH from that resourceVersion, applying ADDED/MODIFIED/DELETED events
+3. When the server-side watch timeout elapses, resume from the last seen resourceVersion
+4. On 410 Gone (resourceVersion too old), re-LIST and start over
+5. On any other error, back off exponentially and re-LIST
+
+Completion Webhooks:
+Callers can register a callback URL per job. When the watch observes the job
+reaching a terminal state (completed / failed), the status dict is POSTed to
+the URL as JSON, with retries and exponential backoff. Each callback fires once.
+
+Status Subscriptions:
+Async consumers (the job status stream route) can subscribe to a job and
+receive every status change on an asyncio.Queue, fed from the same watch
+stream, so streaming a job's status needs no watch request or thread of its own.
+
+The watch runs in a daemon thread because the Kubernetes client is blocking.
+"""
+import asyncio
+import ipaddress
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import orjson
+import urllib3
+from typing import Dict, Any, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from kubernetes import watch
+from kubernetes.client.rest import ApiException
+
+from app.services.eks_operations import (
+    TERMINAL_JOB_STATES,
+    EKSOperationsService,
+    format_job_status,
+    list_all
+)
+from app.utils.logger import get_logger
+from app.core.config import settings
+
+logger = get_logger(__name__, settings.log_level)
+
+# Labels applied by EKSOperationsService.create_job
+JOB_LABEL_SELECTOR = "app=eks-api"
+
+_WEBHOOK_ALLOWED_HOSTS = tuple(
+    host.strip().lower() for host in settings.webhook_allowed_hosts.split(",") if host.strip()
+)
+
+
+def validate_callback_url(callback_url: str) -> None:
+    """
+    Check that a completion webhook URL may be called.
+    
+    Webhooks are POSTed from inside the VPC, so only http(s) URLs with a
+    host are accepted, and the host must match WEBHOOK_ALLOWED_HOSTS when
+    it is set. Without an allowlist, IP addresses that are loopback,
+    link-local (instance metadata), multicast or otherwise reserved are
+    rejected.
+    
+    Raises:
+        ValueError: If the URL is not acceptable (message suitable for a 422)
+    """
+    try:
+        parts = urlsplit(callback_url)
+        host = (parts.hostname or "").lower()
+        parts.port  # raises ValueError on an invalid port
+    except ValueError:
+        raise ValueError("callback_url is not a valid URL")
+    if parts.scheme not in ("http", "https") or not host:
+        raise ValueError("callback_url must be an http or https URL with a host")
+    
+    if _WEBHOOK_ALLOWED_HOSTS:
+        if not any(
+            host == allowed or (allowed.startswith(".") and host.endswith(allowed))
+            for allowed in _WEBHOOK_ALLOWED_HOSTS
+        ):
+            raise ValueError(f"callback_url host {host} is not in WEBHOOK_ALLOWED_HOSTS")
+        return
+    
+    if host == "localhost" or host.endswith(".localhost"):
+        raise ValueError(f"callback_url host {host} is not allowed")
+    try:
+        address = ipaddress.ip_address(host)
+    except ValueError:
+        return
+    if (
+        address.is_loopback or address.is_link_local or address.is_multicast
+        or address.is_reserved or address.is_unspecified
+    ):
+        raise ValueError(f"callback_url host {host} is not allowed")
+
+
+class JobStatusWatcher:
+    """
+    Maintains job status for all API-managed jobs from a Kubernetes watch stream.
+
+    Reads (get) are plain dict lookups and safe to call from the event loop;
+    all writes happen on the watcher thread.
+    """
+
+    def __init__(
+        self,
+        service: EKSOperationsService,
+        watch_timeout_seconds: int = 300,
+        max_backoff_seconds: float = 60.0,
+        webhook_max_attempts: int = 5,
+        webhook_timeout_seconds: float = 10.0
+    ):
+        """
+        Args:
+            service: Initialized EKS operations service (provides BatchV1Api)
+            watch_timeout_seconds: Server-side timeout for each watch request
+            max_backoff_seconds: Upper bound for the retry delay after errors
+            webhook_max_attempts: Delivery attempts per completion webhook
+            webhook_timeout_seconds: HTTP timeout for each webhook attempt
+        """
+        self._service = service
+        self._watch_timeout_seconds = watch_timeout_seconds
+        self._max_backoff_seconds = max_backoff_seconds
+        self._statuses: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._synced = False
+        self._stop_event = threading.Event()
+        self._watch: Optional[watch.Watch] = None
+        self._thread: Optional[threading.Thread] = None
+        self._webhook_max_attempts = webhook_max_attempts
+        self._webhook_timeout_seconds = webhook_timeout_seconds
+        self._callbacks: Dict[Tuple[str, str], str] = {}
+        self._callbacks_lock = threading.Lock()
+        self._subscribers: Dict[Tuple[str, str], List[Tuple[asyncio.AbstractEventLoop, asyncio.Queue]]] = {}
+        self._subscribers_lock = threading.Lock()
+        self._webhook_executor = ThreadPoolExecutor(
+            max_workers=4,
+            thread_name_prefix="job-webhook"
+        )
+        # Shared keep-alive pool for webhook deliveries (one pool per callback
+        # host, one connection per delivery thread), instead of a new
+        # connection and TLS handshake per POST
+        self._webhook_http = urllib3.PoolManager(
+            num_pools=16,
+            maxsize=4,
+            timeout=urllib3.Timeout(total=webhook_timeout_seconds),
+            retries=False
+        )
+
+    @property
+    def synced(self) -> bool:
+        """True once the initial LIST has populated the cache."""
+        return self._synced
+
+    def get(self, namespace: str, job_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached status for a job, or None if unknown.
+
+        None means the caller must fall back to the Kubernetes API: either the
+        cache is not synced yet, or the job is not managed by this API.
+        """
+        if not self._synced:
+            return None
+        return self._statuses.get((namespace, job_name))
+
+    def register_callback(self, namespace: str, job_name: str, callback_url: str) -> None:
+        """
+        Register a URL to be notified once the job completes or fails.
+
+        Replaces any previously registered URL for the same job. If the job is
+        already known to be in a terminal state, the webhook fires immediately.
+        
+        Raises:
+            ValueError: If the URL is rejected by validate_callback_url()
+        """
+        validate_callback_url(callback_url)
+        key = (namespace, job_name)
+        with self._callbacks_lock:
+            self._callbacks[key] = callback_url
+        logger.info("Registered completion webhook: job=%s namespace=%s", job_name, namespace)
+
+        status = self.get(namespace, job_name)
+        if status is not None:
+            self._notify_if_done(key, status)
+
+    def subscribe(self, namespace: str, job_name: str) -> asyncio.Queue:
+        """
+        Subscribe to status changes of a job; call from the event loop.
+        
+        Returns a queue that receives each new status dict of the job, and
+        None when the job is deleted or the watcher stops. Statuses are
+        pushed from the watcher thread with call_soon_threadsafe. Read the
+        current status with get() after subscribing, so no change is missed.
+        Always pair with unsubscribe().
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        with self._subscribers_lock:
+            self._subscribers.setdefault((namespace, job_name), []).append(
+                (asyncio.get_running_loop(), queue)
+            )
+        return queue
+    
+    def unsubscribe(self, namespace: str, job_name: str, queue: asyncio.Queue) -> None:
+        """Remove a subscription created by subscribe() (no-op if already gone)."""
+        key = (namespace, job_name)
+        with self._subscribers_lock:
+            subscribers = self._subscribers.get(key)
+            if subscribers is None:
+                return
+            subscribers[:] = [entry for entry in subscribers if entry[1] is not queue]
+            if not subscribers:
+                del self._subscribers[key]
+    
+    def _publish(self, key: Tuple[str, str], status: Optional[Dict[str, Any]]) -> None:
+        """Push a job status (None: job gone) to the job's subscribers."""
+        with self._subscribers_lock:
+            subscribers = list(self._subscribers.get(key, ()))
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, status)
+            except RuntimeError:
+                # Event loop already closed (shutdown)
+                pass
+    
+    def start(self) -> None:
+        """Start the watcher thread."""
+        if self._thread is not None:
+            return
+        logger.info("Starting job status watcher (label_selector=%s)", JOB_LABEL_SELECTOR)
+        self._thread = threading.Thread(
+            target=self._run,
+            name="job-status-watcher",
+            daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Signal the watcher thread to stop (does not block on the open stream)."""
+        logger.info("Stopping job status watcher")
+        self._stop_event.set()
+        if self._watch is not None:
+            self._watch.stop()
+        self._synced = False
+        # End open status streams
+        with self._subscribers_lock:
+            keys = list(self._subscribers)
+        for key in keys:
+            self._publish(key, None)
+        self._webhook_executor.shutdown(wait=False)
+        self._webhook_http.clear()
+
+    def _notify_if_done(self, key: Tuple[str, str], status: Dict[str, Any]) -> None:
+        """Fire the registered webhook for a job if it reached a terminal state."""
+        if status["state"] not in TERMINAL_JOB_STATES:
+            return
+        with self._callbacks_lock:
+            callback_url = self._callbacks.pop(key, None)
+        if callback_url is not None:
+            self._webhook_executor.submit(self._deliver_webhook, callback_url, status)
+
+    def _deliver_webhook(self, callback_url: str, status: Dict[str, Any]) -> None:
+        """POST the job status to the callback URL, retrying with exponential backoff."""
+        body = orjson.dumps(status)
+        delay = 1.0
+
+        for attempt in range(1, self._webhook_max_attempts + 1):
+            try:
+                response = self._webhook_http.request(
+                    "POST",
+                    callback_url,
+                    body=body,
+                    headers={"Content-Type": "application/json"}
+                )
+                if response.status >= 400:
+                    raise ValueError(f"HTTP {response.status}")
+                logger.info(
+                    "Completion webhook delivered: job=%s state=%s status=%s",
+                    status['job_name'], status['state'], response.status
+                )
+                return
+            except Exception as e:
+                logger.warning(
+                    "Completion webhook attempt %d/%d failed for job %s: %s",
+                    attempt, self._webhook_max_attempts, status['job_name'], e
+                )
+                if attempt < self._webhook_max_attempts:
+                    time.sleep(delay)
+                    delay *= 2
+
+        logger.error("Giving up on completion webhook for job %s (%s)", status['job_name'], callback_url)
+
+    def _list(self) -> str:
+        """
+        LIST all managed jobs (paginated), replace the cache, and return the list resourceVersion.
+        """
+        self._service.ensure_ready()
+        jobs, resource_version = list_all(
+            self._service.k8s_batch_api.list_job_for_all_namespaces,
+            label_selector=JOB_LABEL_SELECTOR
+        )
+        self._statuses = {
+            (job.metadata.namespace, job.metadata.name): format_job_status(job)
+            for job in jobs
+        }
+        self._synced = True
+
+        # Catch up on completions that happened while no watch was open
+        with self._callbacks_lock:
+            pending = list(self._callbacks)
+        for key in pending:
+            status = self._statuses.get(key)
+            if status is not None:
+                self._notify_if_done(key, status)
+        # ... and on changes subscribers missed (streams skip repeats)
+        with self._subscribers_lock:
+            subscribed = list(self._subscribers)
+        for key in subscribed:
+            status = self._statuses.get(key)
+            if status is not None:
+                self._publish(key, status)
+
+        logger.debug(
+            "Job status watcher synced %d jobs (resource_version=%s)",
+            len(self._statuses), resource_version
+        )
+        return resource_version
+
+    def _apply(self, event: Dict[str, Any]) -> None:
+        """Apply a single watch event to the cache."""
+        job = event["object"]
+        key = (job.metadata.namespace, job.metadata.name)
+        if event["type"] == "DELETED":
+            self._statuses.pop(key, None)
+            with self._callbacks_lock:
+                self._callbacks.pop(key, None)
+            self._publish(key, None)
+        else:
+            status = format_job_status(job)
+            self._statuses[key] = status
+            self._notify_if_done(key, status)
+            self._publish(key, status)
+
+    def _run(self) -> None:
+        """Watcher thread body: LIST, then WATCH until stopped."""
+        backoff = 1.0
+        resource_version = None
+
+        while not self._stop_event.is_set():
+            try:
+                if resource_version is None:
+                    resource_version = self._list()
+                else:
+                    # Long-lived process: refresh the token before reconnecting
+                    self._service.ensure_ready()
+
+                self._watch = watch.Watch()
+                for event in self._watch.stream(
+                    self._service.k8s_batch_api.list_job_for_all_namespaces,
+                    label_selector=JOB_LABEL_SELECTOR,
+                    resource_version=resource_version,
+                    timeout_seconds=self._watch_timeout_seconds
+                ):
+                    self._apply(event)
+                    if self._stop_event.is_set():
+                        break
+
+                # Watch timed out normally: resume from the last seen version
+                resource_version = self._watch.resource_version or resource_version
+                backoff = 1.0
+
+            except ApiException as e:
+                if e.status == 410:
+                    logger.info("Job watch resourceVersion expired (410 Gone), re-listing")
+                    resource_version = None
+                    continue
+                logger.warning(
+                    "Job status watcher API error: %s (status=%s), retrying in %.0fs",
+                    e.reason, e.status, backoff
+                )
+                resource_version = None
+                self._synced = False
+                self._stop_event.wait(backoff)
+                backoff = min(backoff * 2, self._max_backoff_seconds)
+
+            except Exception as e:
+                logger.warning("Job status watcher error: %s, retrying in %.0fs", e, backoff)
+                resource_version = None
+                self._synced = False
+                self._stop_event.wait(backoff)
+                backoff = min(backoff * 2, self._max_backoff_seconds)
+
+        logger.info("Job status watcher stopped")
@@ -0,0 +1,116 @@
+"""
+In-process caching helpers for the EKS API application.
+Used to absorb repeated read-only polls before they reach the Kubernetes API server.
+"""
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Small time-based cache with an optional stale-if-error window.
+
+    Each entry is stored with two deadlines:
+    - fresh_until: entry is returned by get() until this point
+    - stale_until: entry is still returned by get_stale() until this point,
+      so callers can fall back to the last known value when upstream fails
+
+    Entries are kept in insertion order; when maxsize is exceeded the oldest
+    entry is evicted. The cache is not thread-safe: use it from the event
+    loop only, or guard it with a lock when it is shared between threads.
+    """
+
+    def __init__(self, ttl: float, stale_ttl: float = 0.0, maxsize: int = 1024):
+        """
+        Args:
+            ttl: Seconds an entry is considered fresh (0 disables fresh hits)
+            stale_ttl: Extra seconds an entry may be served on upstream errors
+            maxsize: Maximum number of entries kept in memory
+        """
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.maxsize = maxsize
+        self._entries: Dict[Hashable, Tuple[Any, float, float]] = {}
+
+    @property
+    def enabled(self) -> bool:
+        """True if entries are retained for fresh or stale reads."""
+        return self.ttl > 0 or self.stale_ttl > 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value if it is still fresh, otherwise None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, fresh_until, stale_until = entry
+        now = time.monotonic()
+        if now < fresh_until:
+            return value
+        if now >= stale_until:
+            del self._entries[key]
+        return None
+
+    def get_stale(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value if it is within the stale-if-error window."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, _, stale_until = entry
+        if time.monotonic() < stale_until:
+            return value
+        del self._entries[key]
+        return None
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the oldest entry if the cache is full."""
+        if not self.enabled:
+            return
+        now = time.monotonic()
+        self._entries.pop(key, None)
+        self._entries[key] = (value, now + self.ttl, now + self.ttl + self.stale_ttl)
+        while len(self._entries) > self.maxsize:
+            del self._entries[next(iter(self._entries))]
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop a single entry (no-op if missing)."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls for the same key into a single execution.
+
+    The first caller for a key starts the call; callers arriving while it is
+    still in flight await the same future and receive the same result (or
+    exception). The key is released as soon as the call finishes, so later
+    callers start a new call. Meant to be used from the event loop only.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run fn() for key, or join the call already in flight for key.
+
+        The shared call is shielded, so a cancelled caller (e.g. a client
+        disconnect) does not cancel the call for the other waiters.
+        """
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fn())
+            self._inflight[key] = future
+            future.add_done_callback(lambda done: self._release(key, done))
+        return await asyncio.shield(future)
+
+    def _release(self, key: Hashable, future: asyncio.Future) -> None:
+        """Drop a finished call; retrieve its exception so it is never reported as unhandled."""
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        if not future.cancelled():
+            future.exception()
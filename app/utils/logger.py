@@ -5,48 +5,77 @@ Provides consistent, contextual logging for debugging and observability.
 import logging
 import sys
 import time
-import uuid
-from typing import Optional, Any
+from contextvars import ContextVar, Token
+from typing import Any, Dict, Optional, Tuple
 from contextlib import contextmanager
 
-# Global request ID for tracing
-_request_id: Optional[str] = None
+from app.utils.metrics import OPERATION_DURATION
 
+# Request ID for tracing, scoped to the current asyncio task / request context.
+# Set once per request by RequestIDMiddleware; asyncio copies the context into
+# each task and asyncio.to_thread, so concurrent requests never see each other's ID.
+_request_id: ContextVar[str] = ContextVar("request_id", default="")
 
-def set_request_id(request_id: str) -> None:
-    """Set the current request ID for logging context."""
-    global _request_id
-    _request_id = request_id
+
+def set_request_id(request_id: str) -> Token:
+    """
+    Set the current request ID for logging context.
+    Returns a token that can be passed to reset_request_id().
+    """
+    return _request_id.set(request_id)
+
+
+def reset_request_id(token: Token) -> None:
+    """Restore the request ID that was active before set_request_id()."""
+    _request_id.reset(token)
 
 
 def get_request_id() -> str:
-    """Get the current request ID or generate a new one."""
-    global _request_id
-    if _request_id is None:
-        _request_id = str(uuid.uuid4())[:12]
-    return _request_id
+    """Get the current request ID (empty string outside of a request)."""
+    return _request_id.get()
 
 
 def clear_request_id() -> None:
     """Clear the current request ID."""
-    global _request_id
-    _request_id = None
+    _request_id.set("")
 
 
 class StructuredFormatter(logging.Formatter):
     """
     Structured logging formatter with request ID and contextual information.
     Format: timestamp | level | module | message [request_id]
+    
+    The timestamp has millisecond precision. The strftime part only changes
+    once per second, so it is cached and only the milliseconds are computed
+    per record; short module names are cached per logger name. Handlers
+    call format() under their lock, so the caches need no locking.
     """
     
+    def __init__(self, fmt: Optional[str] = None, datefmt: Optional[str] = None, **kwargs: Any):
+        super().__init__(fmt, datefmt, **kwargs)
+        self._ts_cache: Tuple[int, str] = (-1, "")
+        self._module_names: Dict[str, str] = {}
+    
+    def _timestamp(self, created: float) -> str:
+        """Format a record creation time as 'YYYY-mm-dd HH:MM:SS.mmm'."""
+        second = int(created)
+        cached_second, prefix = self._ts_cache
+        if second != cached_second:
+            prefix = time.strftime(self.datefmt or '%Y-%m-%d %H:%M:%S', self.converter(second))
+            self._ts_cache = (second, prefix)
+        return f"{prefix}.{int((created - second) * 1000):03d}"
+    
     def format(self, record: logging.LogRecord) -> str:
         """Format log record with structure and request ID."""
         request_id = get_request_id()
         
         # Basic structure
-        timestamp = self.formatTime(record, self.datefmt or '%Y-%m-%d %H:%M:%S.%f')[:-3]
+        timestamp = self._timestamp(record.created)
         level = record.levelname
-        module = record.name.split('.')[-1]  # Last component of module name
+        module = self._module_names.get(record.name)
+        if module is None:
+            # Last component of module name
+            module = self._module_names[record.name] = record.name.rsplit('.', 1)[-1]
         message = record.getMessage()
         
         # Build formatted message
@@ -63,6 +92,15 @@ class StructuredFormatter(logging.Formatter):
         return formatted
 
 
+_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+
 def get_logger(name: str, level: str = "INFO") -> logging.Logger:
     """
     Create and configure a structured logger with console output.
@@ -75,11 +113,12 @@ def get_logger(name: str, level: str = "INFO") -> logging.Logger:
         Configured logger instance
     """
     logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, level.upper()))
     logger.propagate = False  # Don't propagate to root logger
     
+    # Configure once: later calls for the same name keep the first level.
     # Create console handler with structured formatting
     if not logger.handlers:
+        logger.setLevel(_LEVELS.get(level.upper(), logging.INFO))
         handler = logging.StreamHandler(sys.stdout)
         formatter = StructuredFormatter()
         handler.setFormatter(formatter)
@@ -93,20 +132,29 @@ def log_operation(logger: logging.Logger, operation: str, **context: Any):
     """
     Context manager for logging operation entry/exit with timing.
     
+    The duration is recorded in the OPERATION_DURATION Prometheus histogram
+    (labelled by operation and success) rather than formatted into the log line.
+    
+    START and successful END lines are logged at DEBUG (the route already
+    logs each request at INFO); the context string is only built when DEBUG
+    is enabled. Failures are always logged with the traceback.
+    
     Usage:
         with log_operation(logger, "create_job", job_name="test"):
             # operation code
             pass
     """
-    context_str = " ".join(f"{k}={v}" for k, v in context.items())
-    logger.info(f"START {operation} {context_str}")
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        logger.debug("START %s %s", operation, " ".join(f"{k}={v}" for k, v in context.items()))
     
-    start_time = time.time()
+    start_time = time.perf_counter()
     try:
         yield
-        duration = time.time() - start_time
-        logger.info(f"END {operation} success=true duration_ms={duration*1000:.1f}")
     except Exception as e:
-        duration = time.time() - start_time
-        logger.exception(f"END {operation} success=false duration_ms={duration*1000:.1f} error={str(e)}")
+        OPERATION_DURATION.labels(operation, "false").observe(time.perf_counter() - start_time)
+        logger.exception("END %s success=false error=%s", operation, e)
         raise
+    OPERATION_DURATION.labels(operation, "true").observe(time.perf_counter() - start_time)
+    if debug:
+        logger.debug("END %s success=true", operation)
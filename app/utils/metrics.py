@@ -0,0 +1,14 @@
+"""
+Prometheus metrics for the EKS API application.
+Exposed on /metrics (see app.main).
+"""
+from prometheus_client import Histogram
+
+# Duration of Kubernetes operations recorded by log_operation.
+# Buckets cover fast cache-like API calls up to slow job/namespace deletions.
+OPERATION_DURATION = Histogram(
+    "eks_operation_duration_seconds",
+    "Duration of EKS/Kubernetes operations",
+    ["operation", "success"],
+    buckets=(0.005, 0.01, 0.05, 0.1, 0.5, 1, 5)
+)